@@ -0,0 +1,88 @@
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy as _
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from auth_app.caching import cache_token, get_cached_token
+from auth_app.tokens import InvalidAccessToken, signed_tokens_enabled, verify_access_token
+from coderr_app.models import Profile
+
+
+class ProfileTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that loads token, user and profile in one joined
+    query. The profile ends up cached on request.user, so permissions and
+    serializers reach it via get_request_profile() without further queries.
+
+    Resolved tokens are served from the two-level token cache
+    (auth_app.caching); only misses hit the database.
+    """
+
+    def authenticate_credentials(self, key):
+        token = get_cached_token(key)
+        if token is None:
+            try:
+                token = Token.objects.select_related('user__profile').get(key=key)
+            except Token.DoesNotExist:
+                raise AuthenticationFailed(_('Invalid token.'))
+            cache_token(token)
+
+        if not token.user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
+
+
+class SignedTokenAuthentication(TokenAuthentication):
+    """
+    Authenticate `Authorization: Bearer <access token>` headers without a
+    database query (see auth_app.tokens). Only active when
+    SIGNED_ACCESS_TOKENS is enabled.
+
+    request.user is an unsaved User carrying id and is_staff, with a Profile
+    holding id and type attached; other fields are not loaded. request.auth
+    is the token payload.
+    """
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        if not signed_tokens_enabled():
+            return None
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed(_('Invalid token header.'))
+        try:
+            access_token = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed(_('Invalid token header.'))
+        return self.authenticate_credentials(access_token)
+
+    def authenticate_credentials(self, key):
+        try:
+            payload = verify_access_token(key)
+        except InvalidAccessToken as exc:
+            raise AuthenticationFailed(str(exc))
+
+        user = User(id=payload['uid'], is_active=True, is_staff=payload['staff'])
+        if payload['pid'] is not None:
+            user.profile = Profile(id=payload['pid'], username=user, type=payload['type'])
+        return (user, payload)
+
+
+def get_request_profile(request):
+    """
+    Return the profile of the authenticated user, or None.
+
+    Uses the instance loaded during authentication; for users authenticated
+    otherwise it costs one query, after which it is cached on the user.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        return None
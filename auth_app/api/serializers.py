@@ -1,7 +1,11 @@
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
 
+from coderr_app.models import Profile
+
 
 class RegistrationSerializer(serializers.ModelSerializer):
     """
@@ -22,29 +26,63 @@ class RegistrationSerializer(serializers.ModelSerializer):
     def validate(self, data):
         if data['password'] != data['repeated_password']:
             raise serializers.ValidationError({'error': 'Passwords do not match.'})
-        if User.objects.filter(email=data['email']).exists():
-            raise serializers.ValidationError({'error': 'Email is already in use.'})
-        if User.objects.filter(username=data['username']).exists():
-            raise serializers.ValidationError({'error': 'Username is already in use.'})
         return data
 
     def create(self, validated_data):
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password']
+        """
+        Create user, profile and token in one transaction.
+
+        Email and username uniqueness is enforced by the database (unique
+        index on auth_user.email, unique username); a conflicting insert is
+        reported with the same payload the former pre-check queries returned.
+        The password is hashed before the transaction starts.
+        """
+        user = self.build_user(validated_data)
+        user.set_password(validated_data['password'])
+        return self.save_user(user, validated_data)
+
+    def build_user(self, validated_data):
+        """Unsaved user without password (hashed separately by the caller)."""
+        return User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data['email']),
         )
+
+    def save_user(self, user, validated_data):
+        try:
+            with transaction.atomic():
+                user.save()
+                Profile.objects.create(
+                    username=user,
+                    email=user.email,
+                    type=validated_data.get('type') or 'customer'
+                )
+                Token.objects.create(user=user)
+        except IntegrityError:
+            # The transaction is rolled back; look up which value now collides
+            if User.objects.filter(email__iexact=user.email).exists():
+                raise serializers.ValidationError({'error': ['Email is already in use.']})
+            if User.objects.filter(username=user.username).exists():
+                raise serializers.ValidationError({'error': ['Username is already in use.']})
+            raise
         return user
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginCredentialsSerializer(serializers.Serializer):
     """
-    Handles user authentication with username and password.
-    Validates credentials and returns user object if successful.
+    Validates the shape of login data without authenticating.
+    Used by the async login view, which authenticates off the request thread.
     """
     username = serializers.CharField()
     password = serializers.CharField()
 
+
+class LoginSerializer(LoginCredentialsSerializer):
+    """
+    Handles user authentication with username and password.
+    Validates credentials and returns user object if successful.
+    """
+
     def validate(self, data):
         username = data.get("username")
         password = data.get("password")
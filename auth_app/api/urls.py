@@ -2,11 +2,21 @@
 URL configuration for authentication endpoints.
 Includes registration, login, and email check routes.
 """
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# Async views offload password hashing to a bounded thread pool (ASGI deployments)
+if getattr(settings, 'ASYNC_AUTH_VIEWS', False):
+  register_view, login_view = views.AsyncRegisterView, views.AsyncLoginView
+else:
+  register_view, login_view = views.RegisterView, views.LoginView
+
 urlpatterns = [
-  path('registration/', views.RegisterView.as_view(), name='register'),
-  path('login/', views.LoginView.as_view(), name='login'),
+  path('registration/', register_view.as_view(), name='register'),
+  path('login/', login_view.as_view(), name='login'),
+  path('hash-pool-stats/', views.HashPoolStatsView.as_view(), name='hash-pool-stats'),
+  path('token/refresh/', views.TokenRefreshView.as_view(), name='token-refresh'),
+  path('token/revoke/', views.TokenRevokeView.as_view(), name='token-revoke'),
   path('email-check/', views.EmailCheckView.as_view(), name='email-check'),
 ]
\ No newline at end of file
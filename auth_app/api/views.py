@@ -1,12 +1,28 @@
+import math
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import make_password
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
-from .serializers import RegistrationSerializer, LoginSerializer
+from .serializers import RegistrationSerializer, LoginSerializer, LoginCredentialsSerializer
 from django.contrib.auth.models import User
 from coderr_app.models import Profile
+from auth_app.api.authentication import SignedTokenAuthentication
+from auth_app.hashing import HashPoolFull, authenticate_offloaded, hash_pool
+from coderr_app.api.renderers import FastJSONRenderer
+from auth_app.tokens import (
+    access_token_response, revoke_access_token, revoke_user_access_tokens, signed_tokens_enabled
+)
 
 
 class RegisterView(APIView):
@@ -20,21 +36,13 @@ class RegisterView(APIView):
         serializer = RegistrationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            
-            # Create Profile for the user
-            user_type = request.data.get('type', 'customer')
-            Profile.objects.create(
-                username=user,
-                email=user.email,
-                type=user_type
-            )
-            
-            token, _ = Token.objects.get_or_create(user=user)
+            token, profile = user.auth_token, user.profile
             return Response({
                 'token': token.key,
                 'username': user.username,
                 'email': user.email,
-                'user_id': user.id
+                'user_id': user.id,
+                **access_token_response(user, profile)
             }, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -55,11 +63,170 @@ class LoginView(APIView):
                 'token': token.key,
                 'username': user.username,
                 'email': user.email,
-                'user_id': user.id
+                'user_id': user.id,
+                **access_token_response(user, Profile.objects.filter(username=user).first())
             }, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class AsyncAuthView(View):
+    """
+    Base for the async login/registration views (ASGI).
+
+    Plain async Django views, since APIView has no async handlers: request
+    parsing, anonymous throttling and JSON rendering follow the DRF
+    defaults so responses match the sync views. Password hashing runs in
+    the bounded hash pool; a saturated pool answers 503.
+    """
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def respond(self, data, status_code, headers=None):
+        return HttpResponse(
+            FastJSONRenderer().render(data), content_type='application/json', status=status_code, headers=headers
+        )
+
+    def check_throttles(self, request):
+        """Return the longest wait of all denying throttles, or None."""
+        waits = []
+        for throttle_class in self.throttle_classes:
+            throttle = throttle_class()
+            if not throttle.allow_request(request, self):
+                waits.append(throttle.wait() or 0)
+        return max(waits) if waits else None
+
+    async def post(self, request, *args, **kwargs):
+        drf_request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+        wait = await sync_to_async(self.check_throttles)(drf_request)
+        if wait is not None:
+            return self.respond(
+                {'detail': f'Request was throttled. Expected available in {math.ceil(wait)} seconds.'},
+                status.HTTP_429_TOO_MANY_REQUESTS, {'Retry-After': str(math.ceil(wait))}
+            )
+        try:
+            data = drf_request.data
+        except ParseError as exc:
+            return self.respond({'detail': str(exc.detail)}, status.HTTP_400_BAD_REQUEST)
+        try:
+            return await self.handle(data)
+        except HashPoolFull:
+            return self.respond(
+                {'detail': 'Too many concurrent authentication requests, retry shortly.'},
+                status.HTTP_503_SERVICE_UNAVAILABLE, {'Retry-After': '1'}
+            )
+
+    async def handle(self, data):
+        raise NotImplementedError
+
+
+class AsyncRegisterView(AsyncAuthView):
+    """
+    Async variant of RegisterView; the password is hashed in the hash pool.
+    """
+
+    async def handle(self, data):
+        serializer = RegistrationSerializer(data=data)
+        if not serializer.is_valid():
+            return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        user = serializer.build_user(serializer.validated_data)
+        user.password = await hash_pool.run(make_password, serializer.validated_data['password'])
+        try:
+            user = await sync_to_async(serializer.save_user)(user, serializer.validated_data)
+        except ValidationError as exc:
+            return self.respond(exc.detail, status.HTTP_400_BAD_REQUEST)
+
+        return self.respond({
+            'token': user.auth_token.key,
+            'username': user.username,
+            'email': user.email,
+            'user_id': user.id,
+            **access_token_response(user, user.profile)
+        }, status.HTTP_201_CREATED)
+
+
+class AsyncLoginView(AsyncAuthView):
+    """
+    Async variant of LoginView; the password check runs in the hash pool.
+    """
+
+    async def handle(self, data):
+        serializer = LoginCredentialsSerializer(data=data)
+        if not serializer.is_valid():
+            return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        user = await authenticate_offloaded(
+            serializer.validated_data['username'], serializer.validated_data['password']
+        )
+        if user is None:
+            return self.respond({'error': ['Invalid credentials.']}, status.HTTP_400_BAD_REQUEST)
+
+        token, _ = await Token.objects.aget_or_create(user=user)
+        profile = await Profile.objects.filter(username=user).afirst()
+        return self.respond({
+            'token': token.key,
+            'username': user.username,
+            'email': user.email,
+            'user_id': user.id,
+            **access_token_response(user, profile)
+        }, status.HTTP_200_OK)
+
+
+class HashPoolStatsView(APIView):
+    """
+    Staff-only queue-depth metrics of this worker's password hash pool.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(hash_pool.stats())
+
+
+class TokenRefreshView(APIView):
+    """
+    Exchanges the permanent token (refresh token) for a new signed access token.
+    Only available when SIGNED_ACCESS_TOKENS is enabled.
+
+    The Authorization header is ignored: clients call this exactly when their
+    access token has expired or been revoked.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        if not signed_tokens_enabled():
+            return Response({'error': 'Signed access tokens are disabled.'}, status=status.HTTP_404_NOT_FOUND)
+        key = request.data.get('token')
+        if not key:
+            return Response({'error': 'Token is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        token = Token.objects.select_related('user__profile').filter(key=key).first()
+        if token is None or not token.user.is_active:
+            return Response({'error': 'Invalid token.'}, status=status.HTTP_401_UNAUTHORIZED)
+        return Response(
+            access_token_response(token.user, getattr(token.user, 'profile', None)),
+            status=status.HTTP_200_OK
+        )
+
+
+class TokenRevokeView(APIView):
+    """
+    Revokes the signed access token of the request, or with {"all": true}
+    every access token issued to the user so far.
+    """
+    authentication_classes = [SignedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        if request.data.get('all'):
+            revoke_user_access_tokens(request.user.id)
+        else:
+            revoke_access_token(request.auth)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 class EmailCheckView(APIView):
     """
     Checks if an email address is already registered.
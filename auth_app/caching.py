@@ -0,0 +1,169 @@
+"""
+Two-level cache for token authentication.
+
+Resolved tokens are kept in a small in-process LRU with a short TTL in
+front of the shared Django cache. Only the fields authentication needs are
+stored (never password hashes); token, user and profile are rebuilt from
+them with the remaining fields deferred. Keys are SHA-256 hashes of the
+token key, so raw tokens never end up in the cache backend.
+Writes to the token, its user or the user's profile delete the shared
+entry and the local one of the current process; other processes drop
+their local copy once the TTL runs out.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.authtoken.models import Token
+
+from coderr_app.models import Profile
+
+
+TOKEN_CACHE_PREFIX = 'auth-token:v2:'
+
+CACHED_USER_FIELDS = ('id', 'username', 'is_active', 'is_staff')
+CACHED_PROFILE_FIELDS = ('id', 'username_id', 'type', 'first_name', 'last_name')
+
+
+def token_cache_timeout():
+    return getattr(settings, 'TOKEN_CACHE_TIMEOUT', 300)
+
+
+def token_local_cache_ttl():
+    return getattr(settings, 'TOKEN_LOCAL_CACHE_TTL', 5)
+
+
+def token_local_cache_size():
+    return getattr(settings, 'TOKEN_LOCAL_CACHE_SIZE', 1024)
+
+
+class LocalTTLCache:
+    """
+    Thread-safe LRU with per-entry expiry.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl, max_size):
+        if ttl <= 0 or max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_token_cache = LocalTTLCache()
+
+
+def token_cache_key(key):
+    return TOKEN_CACHE_PREFIX + hashlib.sha256(key.encode()).hexdigest()
+
+
+def token_cache_entry(token):
+    """
+    Reduce a token loaded with select_related('user__profile') to the
+    fields authentication needs.
+    """
+    user = token.user
+    try:
+        profile = {field: getattr(user.profile, field) for field in CACHED_PROFILE_FIELDS}
+    except Profile.DoesNotExist:
+        profile = None
+    return {
+        'key': token.key,
+        'user': {field: getattr(user, field) for field in CACHED_USER_FIELDS},
+        'profile': profile,
+    }
+
+
+def build_instance(model, values):
+    """
+    Rebuild a model instance as if loaded from the database with only the
+    given fields; the others are deferred and saving writes only these.
+    """
+    fields = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(DEFAULT_DB_ALIAS, fields, [values[field] for field in fields])
+
+
+def build_token(entry):
+    """
+    Rebuild token, user and profile from a cache entry.
+    """
+    user = build_instance(User, entry['user'])
+    if entry['profile'] is None:
+        # Cache the missing profile, so user.profile raises without a query
+        User.profile.related.set_cached_value(user, None)
+    else:
+        user.profile = build_instance(Profile, entry['profile'])
+    token = build_instance(Token, {'key': entry['key'], 'user_id': user.pk})
+    token.user = user
+    return token
+
+
+def get_cached_token(key):
+    """
+    Return the cached token for a key, or None. Shared cache hits are
+    promoted to the local cache.
+    """
+    cache_key = token_cache_key(key)
+    entry = local_token_cache.get(cache_key)
+    if entry is None:
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        local_token_cache.set(cache_key, entry, token_local_cache_ttl(), token_local_cache_size())
+    return build_token(entry)
+
+
+def cache_token(token):
+    """
+    Store a token loaded with select_related('user__profile') in both levels.
+    """
+    cache_key = token_cache_key(token.key)
+    entry = token_cache_entry(token)
+    cache.set(cache_key, entry, token_cache_timeout())
+    local_token_cache.set(cache_key, entry, token_local_cache_ttl(), token_local_cache_size())
+
+
+def invalidate_token(key):
+    cache_key = token_cache_key(key)
+    local_token_cache.delete(cache_key)
+    cache.delete(cache_key)
+
+
+def invalidate_user_tokens(user_id):
+    """
+    Drop the cached tokens of a user, e.g. after deactivation or a password change.
+    """
+    for key in Token.objects.filter(user_id=user_id).values_list('key', flat=True):
+        invalidate_token(key)
@@ -0,0 +1,108 @@
+"""
+Bounded thread pool for password hashing in the async auth views.
+
+PBKDF2 (and bcrypt) release the GIL, so hashing in worker threads keeps the
+event loop free for other requests. The pool is sized to the CPU count
+(PASSWORD_HASH_WORKERS) and admits at most PASSWORD_HASH_MAX_PENDING jobs
+(running plus queued); beyond that requests are rejected instead of piling
+up, so a login storm cannot starve the rest of the API.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password, verify_password
+
+
+class HashPoolFull(Exception):
+    """Raised when the hash pool already holds its maximum number of jobs."""
+
+
+def hash_workers():
+    return getattr(settings, 'PASSWORD_HASH_WORKERS', None) or os.cpu_count() or 1
+
+
+def hash_max_pending():
+    return getattr(settings, 'PASSWORD_HASH_MAX_PENDING', None) or hash_workers() * 16
+
+
+class PasswordHashPool:
+    """
+    Thread pool with an admission cap and queue-depth counters.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=hash_workers(), thread_name_prefix='password-hash')
+            return self._executor
+
+    async def run(self, func, *args):
+        """
+        Run func(*args) in the pool, or raise HashPoolFull if it is saturated.
+        """
+        executor = self.executor
+        with self._lock:
+            if self.pending >= hash_max_pending():
+                self.rejected += 1
+                raise HashPoolFull()
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, functools.partial(func, *args))
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': hash_workers(),
+                'max_pending': hash_max_pending(),
+                'pending': self.pending,
+                'peak_pending': self.peak_pending,
+                'completed': self.completed,
+                'rejected': self.rejected,
+            }
+
+
+hash_pool = PasswordHashPool()
+
+
+async def authenticate_offloaded(username, password):
+    """
+    Async equivalent of authenticate() with the default ModelBackend.
+
+    Database access uses the async ORM; only the hashing runs in the pool.
+    Unknown users still cost one hash to keep timing uniform, and outdated
+    hashes are upgraded like check_password() does.
+    """
+    UserModel = get_user_model()
+    try:
+        user = await UserModel._default_manager.aget_by_natural_key(username)
+    except UserModel.DoesNotExist:
+        await hash_pool.run(make_password, password)
+        return None
+
+    is_correct, must_update = await hash_pool.run(verify_password, password, user.password)
+    if not is_correct or not user.is_active:
+        return None
+    if must_update:
+        user.password = await hash_pool.run(make_password, password)
+        await user.asave(update_fields=['password'])
+    return user
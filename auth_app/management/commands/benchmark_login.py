@@ -0,0 +1,128 @@
+import asyncio
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncRequestFactory, RequestFactory
+
+from auth_app.api.views import AsyncLoginView, EmailCheckView, LoginView
+from auth_app.hashing import hash_pool
+from coderr_app.models import Profile
+
+
+USERNAME = 'benchmark_login'
+PASSWORD = 'benchmark-password'
+
+
+class Command(BaseCommand):
+    """
+    Compare login throughput of the sync LoginView on a fixed number of
+    worker threads with AsyncLoginView on one event loop.
+
+    While the logins run, a cheap unrelated request (email check) is sent
+    every few milliseconds; its latency shows how much a login storm stalls
+    the rest of the API. Uses a throwaway user that is deleted afterwards;
+    throttling is disabled for the benchmark.
+    """
+    help = 'Benchmark concurrent logins on sync worker threads versus the async view.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=64)
+        parser.add_argument('--workers', type=int, default=2, help='Sync worker threads.')
+        parser.add_argument('--concurrency', type=int, default=32, help='Logins in flight in async mode.')
+        parser.add_argument('--ping-interval', type=float, default=0.01, help='Seconds between unrelated requests.')
+
+    def handle(self, *args, **options):
+        if User.objects.filter(username=USERNAME).exists():
+            raise CommandError(f'User "{USERNAME}" already exists.')
+        user = User.objects.create_user(username=USERNAME, email='benchmark-login@coderr.de', password=PASSWORD)
+        Profile.objects.create(username=user, email=user.email, type='customer')
+        try:
+            for name, runner in (('sync', self.run_sync), ('async', self.run_async)):
+                elapsed, statuses, pings = runner(options)
+                self.report(name, options['logins'], elapsed, statuses, pings)
+            stats = hash_pool.stats()
+            self.stdout.write(
+                f"hash pool: {stats['workers']} workers, peak queue depth {stats['peak_pending']}"
+                f"/{stats['max_pending']}, rejected {stats['rejected']}"
+            )
+        finally:
+            user.delete()
+
+    def login_body(self):
+        return json.dumps({'username': USERNAME, 'password': PASSWORD})
+
+    def run_sync(self, options):
+        factory = RequestFactory()
+        login = LoginView.as_view(throttle_classes=[])
+        ping = EmailCheckView.as_view(throttle_classes=[])
+
+        def call(view, request):
+            try:
+                return view(request).status_code
+            finally:
+                connections.close_all()
+
+        def timed_ping(submitted_at):
+            call(ping, factory.get('/api/email-check/', {'email': 'nobody@coderr.de'}))
+            return time.perf_counter() - submitted_at
+
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            started = time.perf_counter()
+            logins = [
+                executor.submit(call, login, factory.post('/api/login/', self.login_body(), content_type='application/json'))
+                for _ in range(options['logins'])
+            ]
+            pings = []
+            while not all(future.done() for future in logins):
+                pings.append(executor.submit(timed_ping, time.perf_counter()))
+                time.sleep(options['ping_interval'])
+            statuses = [future.result() for future in logins]
+            elapsed = time.perf_counter() - started
+            return elapsed, statuses, [future.result() for future in pings]
+
+    def run_async(self, options):
+        factory = AsyncRequestFactory()
+        login = AsyncLoginView.as_view(throttle_classes=[])
+        # Sync views run in the shared thread-sensitive executor under ASGI, too
+        ping = sync_to_async(EmailCheckView.as_view(throttle_classes=[]))
+
+        async def run():
+            semaphore = asyncio.Semaphore(options['concurrency'])
+
+            async def one_login():
+                async with semaphore:
+                    request = factory.post('/api/login/', self.login_body(), content_type='application/json')
+                    return (await login(request)).status_code
+
+            async def timed_ping():
+                submitted_at = time.perf_counter()
+                await ping(factory.get('/api/email-check/', {'email': 'nobody@coderr.de'}))
+                return time.perf_counter() - submitted_at
+
+            started = time.perf_counter()
+            logins = asyncio.gather(*(one_login() for _ in range(options['logins'])))
+            pings = []
+            while not logins.done():
+                pings.append(asyncio.ensure_future(timed_ping()))
+                await asyncio.sleep(options['ping_interval'])
+            statuses = await logins
+            elapsed = time.perf_counter() - started
+            return elapsed, statuses, await asyncio.gather(*pings)
+
+        return asyncio.run(run())
+
+    def report(self, name, logins, elapsed, statuses, pings):
+        ok = statuses.count(200)
+        pings = sorted(pings) or [0]
+        p95 = pings[min(len(pings) - 1, int(len(pings) * 0.95))]
+        self.stdout.write(
+            f'{name:>5}: {ok}/{logins} logins ok, {statuses.count(503)} rejected, '
+            f'{elapsed:6.2f} s ({ok / elapsed:7.1f}/s)  '
+            f'unrelated request p50 {statistics.median(pings) * 1000:7.1f} ms, p95 {p95 * 1000:7.1f} ms'
+        )
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Enforce unique user emails in the database so concurrent registrations
+    cannot both pass the uniqueness check. Users without email (e.g. created
+    via createsuperuser) are excluded.
+    """
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX auth_user_email_unique ON auth_user (email) WHERE email <> ''",
+            "DROP INDEX auth_user_email_unique",
+        ),
+    ]
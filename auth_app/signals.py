@@ -0,0 +1,44 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from auth_app.caching import invalidate_token, invalidate_user_tokens
+from auth_app.tokens import revoke_user_access_tokens
+from coderr_app.models import Profile
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """
+    Stop serving deleted tokens from the token cache. Signed access tokens
+    issued for it are revoked as well.
+    """
+    key, user_id = instance.key, instance.user_id
+    transaction.on_commit(lambda: invalidate_token(key))
+    transaction.on_commit(lambda: revoke_user_access_tokens(user_id))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_token(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the cached token on any user change (deactivation, password change,
+    ...). The last_login update on every login is skipped.
+    """
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user_tokens(user_id))
+    if not instance.is_active or getattr(instance, '_password', None) is not None or kwargs.get('signal') is post_delete:
+        # Deactivation, password change or deletion also ends signed access tokens
+        transaction.on_commit(lambda: revoke_user_access_tokens(user_id))
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_token(sender, instance, **kwargs):
+    """The profile is cached together with the token."""
+    user_id = instance.username_id
+    transaction.on_commit(lambda: invalidate_user_tokens(user_id))
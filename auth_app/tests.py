@@ -1,3 +1,62 @@
-from django.test import TestCase
+import threading
+from collections import Counter
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection, connections
+from django.test import TransactionTestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from coderr_app.models import Profile
+
+
+# A fast hasher keeps the requests racing in the database rather than in PBKDF2
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ConcurrentRegistrationTests(TransactionTestCase):
+    """
+    Registrations racing for the same emails: exactly one wins per email,
+    the others get the usual 400 payload, and every created user has a
+    profile and a token.
+    """
+    threads = 16
+    emails = 4
+
+    def setUp(self):
+        if connection.is_in_memory_db():
+            self.skipTest('Needs a file test database, set TEST_DATABASE_NAME.')
+
+    def register(self, index, barrier, results):
+        try:
+            barrier.wait()
+            response = APIClient().post('/api/registration/', {
+                'username': f'racer{index}',
+                'email': f'racer{index % self.emails}@coderr.de',
+                'password': 'asdasd',
+                'repeated_password': 'asdasd',
+            }, format='json')
+            results.append((response.status_code, str(response.json().get('error'))))
+        except Exception as exc:
+            results.append(repr(exc))
+        finally:
+            connections.close_all()
+
+    def test_concurrent_registration(self):
+        barrier = threading.Barrier(self.threads)
+        results = []
+        workers = [
+            threading.Thread(target=self.register, args=(index, barrier, results))
+            for index in range(self.threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(Counter(results), {
+            (201, 'None'): self.emails,
+            (400, "['Email is already in use.']"): self.threads - self.emails,
+        })
+        self.assertEqual(User.objects.count(), self.emails)
+        self.assertEqual(User.objects.values('email').distinct().count(), self.emails)
+        self.assertEqual(Profile.objects.count(), self.emails)
+        self.assertEqual(Token.objects.count(), self.emails)
@@ -0,0 +1,90 @@
+"""
+Signed short-lived access tokens.
+
+Access tokens are HMAC-signed (django.core.signing, keyed with SECRET_KEY)
+and carry user id, profile id, profile type and staff flag, so they verify
+without touching the database. The DB-backed Token key acts as refresh
+token. Revocation is checked against the cache: single tokens by their jti,
+all tokens of a user by a "not before" timestamp.
+"""
+import secrets
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+
+ACCESS_TOKEN_SALT = 'auth_app.access-token'
+REVOKED_TOKEN_PREFIX = 'auth-revoked:'
+REVOKED_USER_PREFIX = 'auth-revoked-user:'
+
+
+class InvalidAccessToken(Exception):
+    """Raised for expired, tampered or revoked access tokens."""
+
+
+def signed_tokens_enabled():
+    return getattr(settings, 'SIGNED_ACCESS_TOKENS', False)
+
+
+def access_token_lifetime():
+    return getattr(settings, 'ACCESS_TOKEN_LIFETIME', 300)
+
+
+def issue_access_token(user, profile):
+    """
+    Return a new access token for the user and the seconds until it expires.
+    """
+    payload = {
+        'uid': user.pk,
+        'pid': profile.pk if profile else None,
+        'type': profile.type if profile else None,
+        'staff': user.is_staff,
+        'jti': secrets.token_urlsafe(12),
+        'iat': time.time(),
+    }
+    return signing.dumps(payload, salt=ACCESS_TOKEN_SALT, compress=False), access_token_lifetime()
+
+
+def access_token_response(user, profile):
+    """
+    Extra fields for login/registration/refresh responses; empty when
+    signed tokens are disabled.
+    """
+    if not signed_tokens_enabled():
+        return {}
+    access_token, expires_in = issue_access_token(user, profile)
+    return {'access_token': access_token, 'expires_in': expires_in}
+
+
+def verify_access_token(access_token):
+    """
+    Return the payload of a valid access token or raise InvalidAccessToken.
+    """
+    try:
+        payload = signing.loads(access_token, salt=ACCESS_TOKEN_SALT, max_age=access_token_lifetime())
+    except signing.SignatureExpired:
+        raise InvalidAccessToken('Access token expired.')
+    except signing.BadSignature:
+        raise InvalidAccessToken('Invalid access token.')
+
+    revoked = cache.get_many([REVOKED_TOKEN_PREFIX + payload['jti'], REVOKED_USER_PREFIX + str(payload['uid'])])
+    if REVOKED_TOKEN_PREFIX + payload['jti'] in revoked:
+        raise InvalidAccessToken('Access token revoked.')
+    not_before = revoked.get(REVOKED_USER_PREFIX + str(payload['uid']))
+    if not_before is not None and payload['iat'] <= not_before:
+        raise InvalidAccessToken('Access token revoked.')
+    return payload
+
+
+def revoke_access_token(payload):
+    """Revoke a single access token until it would have expired anyway."""
+    remaining = payload['iat'] + access_token_lifetime() - time.time()
+    if remaining > 0:
+        cache.set(REVOKED_TOKEN_PREFIX + payload['jti'], True, int(remaining) + 1)
+
+
+def revoke_user_access_tokens(user_id):
+    """Revoke every access token issued to the user so far."""
+    cache.set(REVOKED_USER_PREFIX + str(user_id), time.time(), access_token_lifetime() + 1)
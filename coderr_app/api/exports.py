@@ -0,0 +1,158 @@
+"""
+Streaming CSV/NDJSON exports.
+
+Rows are read with values().iterator(chunk_size) and encoded one chunk at a
+time, so memory stays flat regardless of the number of exported rows and
+the first bytes leave before the query has been paged through. Under ASGI
+the chunks are handed out through an async iterator, since Django would
+otherwise consume a sync iterator completely before sending anything.
+"""
+import csv
+import json
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import serializers
+from rest_framework.negotiation import BaseContentNegotiation
+
+from coderr_app.api.renderers import FastJSONRenderer
+
+
+# Export column -> values() lookup; columns match the API representation
+ORDER_EXPORT_FIELDS = {
+    'id': 'id',
+    'customer_user': 'customer_user__username_id',
+    'business_user': 'business_user__username_id',
+    'title': 'title',
+    'revisions': 'revisions',
+    'delivery_time_in_days': 'delivery_time_in_days',
+    'price': 'price',
+    'features': 'features',
+    'offer_type': 'offer_type',
+    'status': 'status',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+
+REVIEW_EXPORT_FIELDS = {
+    'id': 'id',
+    'business_user': 'business_user__username_id',
+    'reviewer': 'reviewer__username_id',
+    'rating': 'rating',
+    'description': 'description',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def export_chunk_size():
+    return getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)
+
+
+class ExportContentNegotiation(BaseContentNegotiation):
+    """
+    Exports take their format from the URL, so the Accept header (e.g.
+    text/csv) must not lead to a 406; error responses use the first renderer.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class _Echo:
+    """File-like object handing csv.writer output straight back."""
+
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, fields):
+    """
+    Yield one dict per row, with Decimals and datetimes formatted as in the API.
+    """
+    datetime_field = serializers.DateTimeField()
+    lookups = list(fields.items())
+    for row in queryset.values(*fields.values()).iterator(chunk_size=export_chunk_size()):
+        item = {}
+        for column, lookup in lookups:
+            value = row[lookup]
+            if isinstance(value, Decimal):
+                value = str(value)
+            elif hasattr(value, 'isoformat'):
+                value = datetime_field.to_representation(value)
+            item[column] = value
+        yield item
+
+
+def _batched(lines, size):
+    """Join encoded lines into chunks of `size` rows to keep writes coarse."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield line[:0].join(batch)
+            batch = []
+    if batch:
+        yield batch[0][:0].join(batch)
+
+
+def _csv_lines(rows, columns):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([
+            json.dumps(value) if isinstance(value, (list, dict)) else value
+            for value in row.values()
+        ])
+
+
+def _ndjson_lines(rows):
+    renderer = FastJSONRenderer()
+    for row in rows:
+        yield renderer.render(row) + b'\n'
+
+
+async def _aiter_chunks(chunks):
+    """
+    Advance a sync chunk iterator in the sync thread, one chunk per call, so
+    the database cursor stays on the thread that opened it.
+    """
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
+
+
+def is_asgi_request(request):
+    """
+    WSGI handlers always set `wsgi.input`; ASGI requests never have it.
+    """
+    return 'wsgi.input' not in request.META
+
+
+def streaming_export(request, queryset, fields, export_format, filename):
+    """
+    Build a StreamingHttpResponse exporting `queryset` as CSV or NDJSON.
+    """
+    rows = iter_rows(queryset, fields)
+    if export_format == 'csv':
+        lines = _csv_lines(rows, list(fields))
+    else:
+        lines = _ndjson_lines(rows)
+
+    chunks = _batched(lines, 100)
+    if is_asgi_request(request):
+        chunks = _aiter_chunks(chunks)
+
+    response = StreamingHttpResponse(chunks, content_type=EXPORT_FORMATS[export_format])
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{export_format}"'
+    return response
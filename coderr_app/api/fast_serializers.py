@@ -0,0 +1,119 @@
+"""
+Fast read path for offers.
+
+Builds the same JSON as OfferListSerializer / OfferDetailViewSerializer from
+.values() projections, without DRF field machinery: the absolute URI prefix
+is computed once per request and rows are assembled as plain dicts.
+"""
+from rest_framework import serializers
+
+from coderr_app.models import Offer, OfferDetail
+
+
+OFFER_FIELDS = (
+    'id', 'user__username_id', 'title', 'image', 'description',
+    'created_at', 'updated_at', 'min_price', 'min_delivery_time',
+)
+USER_DETAIL_FIELDS = (
+    'user__first_name', 'user__last_name', 'user__username__username',
+)
+DETAIL_FIELDS = (
+    'id', 'offer_id', 'title', 'revisions', 'delivery_time_in_days',
+    'price', 'features', 'offer_type',
+)
+
+
+class OfferProjectionSerializer:
+    """
+    Serialize offers from value dicts. `expand` follows the ?expand= semantics
+    of the regular serializers.
+    """
+
+    def __init__(self, request=None, expand=()):
+        self.expand_details = 'details' in expand
+        self.base_url = request.build_absolute_uri('/')[:-1] if request is not None else ''
+        self.datetime_field = serializers.DateTimeField()
+        self.image_storage = Offer._meta.get_field('image').storage
+
+    @staticmethod
+    def list_fields():
+        return OFFER_FIELDS + USER_DETAIL_FIELDS
+
+    @staticmethod
+    def detail_fields():
+        return OFFER_FIELDS
+
+    def absolute_url(self, path):
+        if path.startswith('/'):
+            return self.base_url + path
+        return path
+
+    def image_url(self, name):
+        if not name:
+            return None
+        return self.absolute_url(self.image_storage.url(name))
+
+    def detail_representation(self, detail):
+        if self.expand_details:
+            return {
+                'id': detail['id'],
+                'title': detail['title'],
+                'revisions': detail['revisions'],
+                'delivery_time_in_days': detail['delivery_time_in_days'],
+                'price': '{:f}'.format(detail['price']),
+                'features': detail['features'],
+                'offer_type': detail['offer_type'],
+            }
+        return {
+            'id': detail['id'],
+            'url': f"{self.base_url}/api/offerdetails/{detail['id']}/",
+        }
+
+    def details_by_offer(self, offer_ids):
+        """
+        Load the details of all given offers in a single query.
+        """
+        fields = DETAIL_FIELDS if self.expand_details else ('id', 'offer_id')
+        details = {offer_id: [] for offer_id in offer_ids}
+        rows = OfferDetail.objects.filter(offer_id__in=offer_ids).order_by('id').values(*fields)
+        for row in rows:
+            details[row['offer_id']].append(self.detail_representation(row))
+        return details
+
+    def offer_representation(self, offer, details):
+        to_datetime = self.datetime_field.to_representation
+        return {
+            'id': offer['id'],
+            'user': offer['user__username_id'],
+            'title': offer['title'],
+            'image': self.image_url(offer['image']),
+            'description': offer['description'],
+            'created_at': to_datetime(offer['created_at']),
+            'updated_at': to_datetime(offer['updated_at']),
+            'details': details,
+            'min_price': offer['min_price'],
+            'min_delivery_time': offer['min_delivery_time'],
+        }
+
+    def serialize_list(self, offers):
+        """
+        Shape of OfferListSerializer(many=True).
+        """
+        details = self.details_by_offer([offer['id'] for offer in offers])
+        data = []
+        for offer in offers:
+            item = self.offer_representation(offer, details[offer['id']])
+            item['user_details'] = {
+                'first_name': offer['user__first_name'],
+                'last_name': offer['user__last_name'],
+                'username': offer['user__username__username'],
+            }
+            data.append(item)
+        return data
+
+    def serialize_detail(self, offer):
+        """
+        Shape of OfferDetailViewSerializer.
+        """
+        details = self.details_by_offer([offer['id']])
+        return self.offer_representation(offer, details[offer['id']])
@@ -0,0 +1,25 @@
+from rest_framework.filters import SearchFilter
+
+from coderr_app import search
+
+
+class OfferSearchFilter(SearchFilter):
+    """
+    Search offers through the full-text index instead of icontains scans.
+
+    Results are ranked by relevance unless the client asks for an explicit
+    ?ordering=. Falls back to SearchFilter on backends without an index.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not search.is_supported():
+            return super().filter_queryset(request, queryset, view)
+
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+
+        queryset = search.search_offers(queryset, terms)
+        if 'search_rank' in queryset.query.annotations and not request.query_params.get('ordering'):
+            queryset = queryset.order_by('search_rank', '-updated_at')
+        return queryset
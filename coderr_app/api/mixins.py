@@ -0,0 +1,36 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET requests with ETag/Last-Modified validators.
+
+    Views implement get_conditional_state() and return a tuple of values that
+    change whenever the payload changes plus the matching timestamp, or None
+    to skip validation. Matching requests get a 304 before the object is
+    loaded or serialized.
+    """
+
+    def get_conditional_state(self):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        state = self.get_conditional_state()
+        if state is None:
+            return super().get(request, *args, **kwargs)
+
+        parts, modified_at = state
+        etag = quote_etag(hashlib.sha1(repr(parts).encode()).hexdigest())
+        last_modified = int(modified_at.timestamp()) if modified_at else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        if 200 <= response.status_code < 300 or response.status_code == 304:
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
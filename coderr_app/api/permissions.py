@@ -1,5 +1,16 @@
 from rest_framework import permissions
 
+from auth_app.api.authentication import get_request_profile
+
+
+def is_request_profile(request, profile_id):
+    """
+    Compare a profile foreign key value with the requesting user's profile
+    without loading the related objects.
+    """
+    profile = get_request_profile(request)
+    return profile is not None and profile.id == profile_id
+
 
 class IsProfileOwner(permissions.BasePermission):
     """
@@ -12,7 +23,7 @@ class IsProfileOwner(permissions.BasePermission):
             return request.user.is_authenticated
         
         # Schreiben ist nur für den Profilbesitzer erlaubt
-        return obj.username == request.user
+        return obj.username_id == request.user.id
 
 
 class IsAuthenticated(permissions.BasePermission):
@@ -33,11 +44,8 @@ class IsBusinessUser(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
         
-        try:
-            profile = request.user.profile
-            return profile.type == 'business'
-        except:
-            return False
+        profile = get_request_profile(request)
+        return profile is not None and profile.type == 'business'
 
 
 class IsOfferOwner(permissions.BasePermission):
@@ -51,7 +59,7 @@ class IsOfferOwner(permissions.BasePermission):
             return request.user.is_authenticated
         
         # Schreiben ist nur für den Offer-Besitzer erlaubt
-        return obj.user.username == request.user
+        return is_request_profile(request, obj.user_id)
 
 
 class IsCustomerUser(permissions.BasePermission):
@@ -63,11 +71,8 @@ class IsCustomerUser(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
         
-        try:
-            profile = request.user.profile
-            return profile.type == 'customer'
-        except:
-            return False
+        profile = get_request_profile(request)
+        return profile is not None and profile.type == 'customer'
 
 
 class IsOrderParticipant(permissions.BasePermission):
@@ -77,8 +82,8 @@ class IsOrderParticipant(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Benutzer muss entweder Kunde oder Business-User der Order sein
-        return (obj.customer_user.username == request.user or 
-                obj.business_user.username == request.user)
+        return (is_request_profile(request, obj.customer_user_id) or
+                is_request_profile(request, obj.business_user_id))
 
 
 class IsBusinessOrderOwner(permissions.BasePermission):
@@ -88,7 +93,7 @@ class IsBusinessOrderOwner(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Nur Business-User der Order kann den Status aktualisieren
-        return obj.business_user.username == request.user
+        return is_request_profile(request, obj.business_user_id)
 
 
 class IsStaffUser(permissions.BasePermission):
@@ -111,4 +116,4 @@ class IsReviewOwner(permissions.BasePermission):
             return request.user.is_authenticated
         
         # Schreiben ist nur für den Review-Ersteller erlaubt
-        return obj.reviewer.username == request.user
+        return is_request_profile(request, obj.reviewer_id)
@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
-from coderr_app.models import Profile, Offer, OfferDetail, Order, Review
+from django.db import transaction
+from coderr_app.models import Profile, Offer, OfferDetail, Order, OrderEvent, Review
+from coderr_app.counters import move_order_counter, change_review_rating
+from coderr_app.signals import offers_bulk_created
+from auth_app.api.authentication import get_request_profile
 from django.contrib.auth.models import User
 
 
@@ -131,13 +135,15 @@ class OfferDetailCreateSerializer(serializers.ModelSerializer):
 
 class OfferDetailUpdateSerializer(serializers.ModelSerializer):
     """
-    Update serializer for offer details.
+    Update serializer for offer details. `delete: true` removes the tier.
     """
+    delete = serializers.BooleanField(write_only=True, required=False)
+
     class Meta:
         model = OfferDetail
         fields = [
             'title', 'revisions', 'delivery_time_in_days', 
-            'price', 'features', 'offer_type'
+            'price', 'features', 'offer_type', 'delete'
         ]
 
 
@@ -158,6 +164,19 @@ class OfferDetailListSerializer(serializers.ModelSerializer):
         return f'/api/offerdetails/{obj.id}/'
 
 
+class ExpandableDetailsMixin:
+    """
+    Inline full OfferDetailSerializer objects instead of {id, url} pairs
+    when the serializer context asks for expand=details.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if 'details' in self.context.get('expand', ()):
+            fields['details'] = OfferDetailSerializer(many=True, read_only=True)
+        return fields
+
+
 class UserDetailsSerializer(serializers.ModelSerializer):
     """
     Embedded user details for offer listings.
@@ -185,12 +204,14 @@ class UserDetailsSerializer(serializers.ModelSerializer):
             }
 
 
-class OfferListSerializer(serializers.ModelSerializer):
+class OfferListSerializer(ExpandableDetailsMixin, serializers.ModelSerializer):
     """
     Offer list serializer with minimal fields and aggregates.
     """
     user = serializers.ReadOnlyField(source='user.username.id')
     details = OfferDetailListSerializer(many=True, read_only=True)
+    min_price = serializers.ReadOnlyField()
+    min_delivery_time = serializers.ReadOnlyField()
     user_details = UserDetailsSerializer(source='user.username', read_only=True)
 
     class Meta:
@@ -227,12 +248,14 @@ class OfferListSerializer(serializers.ModelSerializer):
             }
 
 
-class OfferDetailViewSerializer(serializers.ModelSerializer):
+class OfferDetailViewSerializer(ExpandableDetailsMixin, serializers.ModelSerializer):
     """
     Single-offer serializer with all details.
     """
     user = serializers.ReadOnlyField(source='user.username.id')
     details = OfferDetailListSerializer(many=True, read_only=True)
+    min_price = serializers.ReadOnlyField()
+    min_delivery_time = serializers.ReadOnlyField()
 
     class Meta:
         model = Offer
@@ -242,6 +265,41 @@ class OfferDetailViewSerializer(serializers.ModelSerializer):
         ]
 
 
+class OfferBulkCreateSerializer(serializers.ListSerializer):
+    """
+    Create a list of offers with two bulk_create statements in one transaction.
+
+    bulk_create sends no signals, so the bookkeeping of the Offer receivers
+    is done via offers_bulk_created. OfferDetail receivers only bump the
+    offer list cache, which that covers as well.
+    """
+
+    def create(self, validated_data):
+        profile = get_request_profile(self.context['request'])
+        offers, details = [], []
+        for item in validated_data:
+            item = dict(item)
+            details_data = item.pop('details')
+            offer = Offer(
+                user=profile,
+                min_price=min(detail['price'] for detail in details_data),
+                min_delivery_time=min(detail['delivery_time_in_days'] for detail in details_data),
+                **item
+            )
+            offers.append(offer)
+            details.append(details_data)
+
+        with transaction.atomic():
+            Offer.objects.bulk_create(offers)
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, **detail_data)
+                for offer, details_data in zip(offers, details)
+                for detail_data in details_data
+            ])
+            offers_bulk_created(offers)
+        return offers
+
+
 class OfferCreateSerializer(serializers.ModelSerializer):
     """
     Create serializer for offers with details.
@@ -251,6 +309,7 @@ class OfferCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Offer
         fields = ['title', 'image', 'description', 'details']
+        list_serializer_class = OfferBulkCreateSerializer
 
     def validate_details(self, value):
         """
@@ -262,13 +321,18 @@ class OfferCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         details_data = validated_data.pop('details')
-        user = self.context['request'].user
-        profile = Profile.objects.get(username=user)
-        
-        offer = Offer.objects.create(user=profile, **validated_data)
+        profile = get_request_profile(self.context['request'])
         
-        for detail_data in details_data:
-            OfferDetail.objects.create(offer=offer, **detail_data)
+        with transaction.atomic():
+            offer = Offer.objects.create(
+                user=profile,
+                min_price=min(detail['price'] for detail in details_data),
+                min_delivery_time=min(detail['delivery_time_in_days'] for detail in details_data),
+                **validated_data
+            )
+            
+            for detail_data in details_data:
+                OfferDetail.objects.create(offer=offer, **detail_data)
         
         return offer
 
@@ -279,6 +343,8 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
     """
     details = OfferDetailUpdateSerializer(many=True, required=False)
 
+    NEW_DETAIL_REQUIRED_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'price']
+
     class Meta:
         model = Offer
         fields = ['title', 'image', 'description', 'details']
@@ -286,22 +352,89 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         details_data = validated_data.pop('details', None)
         
-        # Update offer fields
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-        
-        # Replace details if provided
-        if details_data is not None:
-            # Delete existing details
-            instance.details.all().delete()
+        with transaction.atomic():
+            # Update offer fields
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save()
             
-            # Create new details
-            for detail_data in details_data:
-                OfferDetail.objects.create(offer=instance, **detail_data)
+            # Upsert details if provided
+            if details_data is not None:
+                self.sync_details(instance, details_data)
+                instance.refresh_detail_aggregates()
         
         return instance
 
+    def sync_details(self, offer, details_data):
+        """
+        Upsert the offer's details by offer_type.
+
+        Existing tiers keep their id and are written with a single
+        bulk_update of the fields that actually changed; only new tiers are
+        inserted. A tier is deleted only on request: with {"delete": true}
+        on PATCH, or by leaving it out on PUT. Tiers that still have orders
+        are never deleted, since that would cascade the orders.
+        """
+        existing = {}
+        duplicates = []
+        for detail in offer.details.all():
+            if detail.offer_type in existing:
+                duplicates.append(detail)
+            else:
+                existing[detail.offer_type] = detail
+
+        changed, changed_fields, created, deleted = [], set(), [], []
+        for idx, detail_data in enumerate(details_data):
+            detail = existing.pop(detail_data['offer_type'], None)
+            if detail_data.pop('delete', False):
+                if detail is None:
+                    raise serializers.ValidationError({
+                        f'details[{idx}].offer_type': ['This offer has no detail of this type.']
+                    })
+                deleted.append(detail)
+                continue
+            if detail is None:
+                missing = [field for field in self.NEW_DETAIL_REQUIRED_FIELDS if field not in detail_data]
+                if missing:
+                    raise serializers.ValidationError({
+                        f'details[{idx}].{field}': ['This field is required.'] for field in missing
+                    })
+                created.append(OfferDetail(offer=offer, **detail_data))
+                continue
+            fields = [field for field, value in detail_data.items() if getattr(detail, field) != value]
+            for field in fields:
+                setattr(detail, field, detail_data[field])
+            if fields:
+                changed.append(detail)
+                changed_fields.update(fields)
+
+        if not self.partial:
+            # PUT replaces the set of tiers
+            deleted.extend(existing.values())
+            deleted.extend(duplicates)
+        if deleted:
+            self.delete_details(deleted)
+        if changed:
+            OfferDetail.objects.bulk_update(changed, sorted(changed_fields))
+        if created:
+            OfferDetail.objects.bulk_create(created)
+        # Details may have been prefetched for the request (?expand=details)
+        getattr(offer, '_prefetched_objects_cache', {}).pop('details', None)
+
+    def delete_details(self, details):
+        """
+        Delete the given details, or reject the update if any has orders.
+        """
+        ids = [detail.pk for detail in details]
+        ordered_types = sorted(set(
+            Order.objects.filter(offer_detail_id__in=ids).values_list('offer_detail__offer_type', flat=True)
+        ))
+        if ordered_types:
+            raise serializers.ValidationError({
+                'details': [f'The {offer_type} detail has orders and cannot be deleted.' for offer_type in ordered_types]
+            })
+        OfferDetail.objects.filter(pk__in=ids).delete()
+
     def validate(self, attrs):
         """
         When updating details, enforce that each detail includes offer_type
@@ -319,6 +452,10 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
                     raise serializers.ValidationError({
                         f'details[{idx}].offer_type': ['This field is required.']
                     })
+                if item['offer_type'] in [other.get('offer_type') for other in details_payload[:idx]]:
+                    raise serializers.ValidationError({
+                        f'details[{idx}].offer_type': ['Each offer type may only appear once.']
+                    })
         return attrs
 
 
@@ -326,8 +463,8 @@ class OrderSerializer(serializers.ModelSerializer):
     """
     Order serializer with all fields for read operations.
     """
-    customer_user = serializers.ReadOnlyField(source='customer_user.username.id')
-    business_user = serializers.ReadOnlyField(source='business_user.username.id')
+    customer_user = serializers.ReadOnlyField(source='customer_user.username_id')
+    business_user = serializers.ReadOnlyField(source='business_user.username_id')
 
     class Meta:
         model = Order
@@ -365,25 +502,27 @@ class OrderCreateSerializer(serializers.ModelSerializer):
 
     def validate_offer_detail_id(self, value):
         """
-        Validate that the referenced OfferDetail exists.
+        Validate that the referenced OfferDetail exists and resolve it
+        (with its offer, which Order.save needs) for create().
         """
         try:
-            OfferDetail.objects.get(id=value)
+            return OfferDetail.objects.select_related('offer').get(id=value)
         except OfferDetail.DoesNotExist:
             raise serializers.ValidationError("Das angegebene Angebotsdetail existiert nicht.")
-        return value
 
     def create(self, validated_data):
-        """Create order for current authenticated customer user."""
-        offer_detail_id = validated_data.pop('offer_detail_id')
-        offer_detail = OfferDetail.objects.get(id=offer_detail_id)
-        user = self.context['request'].user
-        customer_profile = Profile.objects.get(username=user)
-        order = Order.objects.create(
-            customer_user=customer_profile,
-            offer_detail=offer_detail,
-            **validated_data
-        )
+        """
+        Create order for current authenticated customer user. The order, its
+        counter increment and its created event are written in one transaction.
+        """
+        offer_detail = validated_data.pop('offer_detail_id')
+        customer_profile = get_request_profile(self.context['request'])
+        with transaction.atomic():
+            order = Order.objects.create(
+                customer_user=customer_profile,
+                offer_detail=offer_detail,
+                **validated_data
+            )
         return order
 
 
@@ -404,6 +543,35 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Ungültiger Status.")
         return value
 
+    def update(self, instance, validated_data):
+        """
+        Update the status, move the order between business counters and
+        log the transition.
+
+        The row is re-read under a lock, so concurrent updates of the same
+        order see each other's status and never move the counters twice.
+        Returns the locked instance.
+        """
+        with transaction.atomic():
+            instance = Order.objects.select_for_update().get(pk=instance.pk)
+            previous_status = instance.status
+            instance = super().update(instance, validated_data)
+            if instance.status != previous_status:
+                move_order_counter(instance.business_user_id, previous_status, instance.status)
+                OrderEvent.record(instance, 'status_changed', previous_status=previous_status)
+        return instance
+
+
+class OrderEventSerializer(serializers.ModelSerializer):
+    """
+    Serializer for entries of the order change feed.
+    """
+    seq = serializers.ReadOnlyField(source='id')
+
+    class Meta:
+        model = OrderEvent
+        fields = ['seq', 'order_id', 'event_type', 'status', 'previous_status', 'created_at']
+
 
 class OrderCountSerializer(serializers.Serializer):
     """
@@ -419,12 +587,27 @@ class CompletedOrderCountSerializer(serializers.Serializer):
     completed_order_count = serializers.IntegerField()
 
 
+class BusinessStatsSerializer(serializers.Serializer):
+    """
+    Serializer for combined business statistics.
+    """
+    business_user = serializers.IntegerField()
+    in_progress_order_count = serializers.IntegerField()
+    completed_order_count = serializers.IntegerField()
+    cancelled_order_count = serializers.IntegerField()
+    total_revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    offer_count = serializers.IntegerField()
+    review_count = serializers.IntegerField()
+    average_rating = serializers.FloatField()
+    rating_histogram = serializers.DictField(child=serializers.IntegerField())
+
+
 class ReviewSerializer(serializers.ModelSerializer):
     """
     Review serializer with all fields.
     """
-    business_user = serializers.ReadOnlyField(source='business_user.username.id')
-    reviewer = serializers.ReadOnlyField(source='reviewer.username.id')
+    business_user = serializers.ReadOnlyField(source='business_user.username_id')
+    reviewer = serializers.ReadOnlyField(source='reviewer.username_id')
 
     class Meta:
         model = Review
@@ -447,24 +630,20 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
 
     def validate_business_user(self, value):
         """
-        Validate that the business user exists and is of type 'business'.
+        Validate that the business user exists and is of type 'business'
+        and resolve it to the business profile.
         """
         try:
-            business_user = User.objects.get(id=value)
-            profile = Profile.objects.get(username=business_user, type='business')
-        except (User.DoesNotExist, Profile.DoesNotExist):
+            return Profile.objects.get(username_id=value, type='business')
+        except Profile.DoesNotExist:
             raise serializers.ValidationError("Der angegebene Business-User existiert nicht.")
-        return value
 
     def validate(self, data):
         """
         Ensure a reviewer can only create one review per business user.
         """
-        user = self.context['request'].user
-        reviewer_profile = Profile.objects.get(username=user)
-        business_user_id = data['business_user']
-        business_user = User.objects.get(id=business_user_id)
-        business_profile = Profile.objects.get(username=business_user, type='business')
+        reviewer_profile = get_request_profile(self.context['request'])
+        business_profile = data['business_user']
         
         # Prüfe, ob bereits eine Bewertung existiert
         if Review.objects.filter(reviewer=reviewer_profile, business_user=business_profile).exists():
@@ -474,18 +653,14 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         return data
 
     def create(self, validated_data):
-        business_user_id = validated_data.pop('business_user')
-        business_user = User.objects.get(id=business_user_id)
-        business_profile = Profile.objects.get(username=business_user, type='business')
-        
-        user = self.context['request'].user
-        reviewer_profile = Profile.objects.get(username=user)
-        
-        review = Review.objects.create(
-            business_user=business_profile,
-            reviewer=reviewer_profile,
-            **validated_data
-        )
+        """
+        Create the review and add it to the aggregated stats in one transaction.
+        """
+        with transaction.atomic():
+            review = Review.objects.create(
+                reviewer=get_request_profile(self.context['request']),
+                **validated_data
+            )
         
         return review
 
@@ -506,6 +681,20 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Die Bewertung muss zwischen 1 und 5 liegen.")
         return value
 
+    def update(self, instance, validated_data):
+        """
+        Update the review and move its rating in the aggregated stats.
+
+        The row is re-read under a lock, so concurrent updates never move
+        the same old rating twice. Returns the locked instance.
+        """
+        with transaction.atomic():
+            instance = Review.objects.select_for_update().get(pk=instance.pk)
+            previous_rating = instance.rating
+            instance = super().update(instance, validated_data)
+            change_review_rating(instance.business_user_id, previous_rating, instance.rating)
+        return instance
+
 
 class BaseInfoSerializer(serializers.Serializer):
     """
@@ -17,17 +17,23 @@ urlpatterns = [
     path('offers/<int:pk>/', views.OfferDetailView.as_view(), name='offer-detail'),
     
     # OfferDetail View - GET für spezifisches OfferDetail
+    path('offerdetails/', views.OfferDetailBatchView.as_view(), name='offerdetail-batch'),
     path('offerdetails/<int:pk>/', views.OfferDetailDetailView.as_view(), name='offerdetail-detail'),
     
     # Order Views - CRUD für Orders
     path('orders/', views.OrderListView.as_view(), name='order-list'),
+    path('orders/export/<str:export_format>/', views.OrderExportView.as_view(), name='order-export'),
+    path('orders/stream/', views.OrderStreamView.as_view(), name='order-stream'),
+    path('orders/changes/', views.OrderChangesView.as_view(), name='order-changes'),
     path('orders/<int:pk>/', views.OrderDetailView.as_view(), name='order-detail'),
     
     # Order Count Views - Statistiken für Business-User
     path('order-count/<int:business_user_id>/', views.OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/', views.CompletedOrderCountView.as_view(), name='completed-order-count'),
+    path('business-stats/<int:business_user_id>/', views.BusinessStatsView.as_view(), name='business-stats'),
     
     # Review Views - CRUD für Reviews
     path('reviews/', views.ReviewListView.as_view(), name='review-list'),
+    path('reviews/export/<str:export_format>/', views.ReviewExportView.as_view(), name='review-export'),
     path('reviews/<int:pk>/', views.ReviewDetailView.as_view(), name='review-detail'),
 ]
\ No newline at end of file
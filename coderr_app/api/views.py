@@ -1,17 +1,36 @@
 from rest_framework import status, generics
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.pagination import PageNumberPagination
-from rest_framework.renderers import JSONRenderer
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.settings import api_settings
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
 from django.contrib.auth.models import User
-from django.db.models import Q, Avg, Count
-from decimal import Decimal
-
-from coderr_app.models import Profile, Offer, OfferDetail, Order, Review
+from django.db.models import Q, Count, Max, Sum, Exists, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+import asyncio
+
+from coderr_app.models import (
+    Profile, Offer, OfferDetail, Order, OrderEvent, Review, BusinessOrderCounter, PlatformStats,
+    order_event_settle_seconds
+)
+from coderr_app.counters import PLATFORM_STATS_ID, rebuild_platform_stats
+from coderr_app.streams import broker, heartbeat_interval
+from coderr_app.caching import (
+    OFFER_LIST_PARAMS, offer_list_cache_key, offer_list_timeout, record_offer_list_lookup,
+    business_stats_cache_key, business_stats_timeout
+)
 from coderr_app.api.serializers import (
     ProfileSerializer, 
     ProfileUpdateSerializer,
@@ -26,13 +45,24 @@ from coderr_app.api.serializers import (
     OrderSerializer,
     OrderCreateSerializer,
     OrderUpdateSerializer,
+    OrderEventSerializer,
     OrderCountSerializer,
     CompletedOrderCountSerializer,
+    BusinessStatsSerializer,
     ReviewSerializer,
     ReviewCreateSerializer,
     ReviewUpdateSerializer,
     BaseInfoSerializer
 )
+from coderr_app.api.fast_serializers import OfferProjectionSerializer
+from coderr_app.api.filters import OfferSearchFilter
+from coderr_app.api.renderers import FastJSONRenderer
+from coderr_app.api.exports import (
+    EXPORT_FORMATS, ORDER_EXPORT_FIELDS, ExportContentNegotiation, REVIEW_EXPORT_FIELDS, streaming_export
+)
+from coderr_app.api.mixins import ConditionalGetMixin
+from auth_app.api.authentication import SignedTokenAuthentication, get_request_profile
+from auth_app.tokens import signed_tokens_enabled
 from coderr_app.api.permissions import (
     IsProfileOwner, IsBusinessUser, IsOfferOwner, 
     IsCustomerUser, IsOrderParticipant, IsBusinessOrderOwner, IsStaffUser,
@@ -40,12 +70,62 @@ from coderr_app.api.permissions import (
 )
 
 
-class ProfileDetailView(generics.RetrieveUpdateAPIView):
+EXPANDABLE_OFFER_FIELDS = {'details'}
+
+
+def parse_datetime_param(params, name, end_of_day=False):
+    """
+    Parse an ISO datetime or date query parameter into an aware datetime.
+    Plain dates mean the start of that day, or the start of the next day
+    with end_of_day (for exclusive upper bounds). Invalid values -> 400.
+    """
+    value = params.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError
+            if end_of_day:
+                day += timedelta(days=1)
+            parsed = datetime.combine(day, datetime.min.time())
+    except ValueError:
+        raise ValidationError({name: ["Invalid date or datetime value."]})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def use_fast_offer_serialization():
+    return getattr(settings, 'OFFER_FAST_SERIALIZATION', True)
+
+
+def get_expand_fields(request):
+    """
+    Parse ?expand=details[,...] into the set of supported relation names.
+    """
+    values = ','.join(request.query_params.getlist('expand'))
+    return {name.strip() for name in values.split(',')} & EXPANDABLE_OFFER_FIELDS
+
+
+class ProfileDetailView(ConditionalGetMixin, generics.RetrieveUpdateAPIView):
     """
     Retrieve and partially update a specific profile.
     """
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated]
+
+    def get_conditional_state(self):
+        """
+        Validate against the profile's updated_at without loading it.
+        """
+        user_id = self.kwargs.get('pk')
+        updated_at = Profile.objects.filter(username_id=user_id).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        return ('profile', user_id, updated_at), updated_at
     
     def get_object(self):
         """
@@ -147,29 +227,69 @@ class OfferPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
 
 
+class OfferCursorPagination(CursorPagination):
+    """
+    Keyset pagination for offers, opted into with ?cursor= (empty for the first page).
+
+    Pages on the active ordering field plus id as tie-breaker and never runs COUNT(*).
+    """
+    page_size_query_param = 'page_size'
+    ordering = '-updated_at'
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering[0].lstrip('-') in ('id', 'pk'):
+            return ordering
+        tie_breaker = '-id' if ordering[0].startswith('-') else 'id'
+        return (ordering[0], tie_breaker)
+
+
 class OfferListView(generics.ListCreateAPIView):
     """
     List offers (public) and create offers (business users).
     """
     pagination_class = OfferPagination
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    # OfferSearchFilter runs last so its relevance ordering is not overridden
+    filter_backends = [DjangoFilterBackend, OrderingFilter, OfferSearchFilter]
     filterset_fields = ['user__username__id']
     search_fields = ['title', 'description']
     ordering_fields = ['updated_at', 'min_price']
     ordering = ['-updated_at']
+
+    @property
+    def paginator(self):
+        """
+        Use keyset pagination when the client sends a cursor parameter.
+        """
+        if not hasattr(self, '_paginator'):
+            if OfferCursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = OfferCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
     
     def get_paginated_response(self, data):
         """
         Ensure a consistent paginated structure in the response.
+        In cursor mode count is null since no COUNT(*) is run.
         """
         paginator = self.paginator
+        if isinstance(paginator, CursorPagination):
+            count = None
+        else:
+            count = paginator.page.paginator.count
         return Response({
-            'count': paginator.page.paginator.count,
+            'count': count,
             'next': paginator.get_next_link(),
             'previous': paginator.get_previous_link(),
             'results': data
         })
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = get_expand_fields(self.request)
+        return context
+
     def get_serializer_class(self):
         if self.request.method == 'POST':
             # Für Erstellung nehmen wir den Create-Serializer für Validierung,
@@ -178,7 +298,9 @@ class OfferListView(generics.ListCreateAPIView):
         return OfferListSerializer
 
     def get_queryset(self):
-        queryset = Offer.objects.all()
+        # Join user and profile up front and load all details of the page
+        # in one query, so the number of queries does not grow with page size
+        queryset = Offer.objects.select_related('user__username').prefetch_related('details')
         
         # Filter by creator_id
         creator_id = self.request.query_params.get('creator_id')
@@ -194,8 +316,11 @@ class OfferListView(generics.ListCreateAPIView):
         if min_price and min_price.strip() and min_price != "":
             try:
                 min_price_decimal = Decimal(min_price)
-                queryset = queryset.filter(details__price__gte=min_price_decimal).distinct()
-            except (ValueError, TypeError):
+                # EXISTS instead of a join, so no DISTINCT over the joined rows is needed
+                queryset = queryset.filter(Exists(
+                    OfferDetail.objects.filter(offer=OuterRef('pk'), price__gte=min_price_decimal)
+                ))
+            except (ValueError, TypeError, InvalidOperation):
                 raise ValidationError({"min_price": ["Invalid decimal value."]})
         
         # Filter by max_delivery_time
@@ -203,7 +328,8 @@ class OfferListView(generics.ListCreateAPIView):
         if max_delivery_time and max_delivery_time.strip() and max_delivery_time != "":
             try:
                 max_delivery_time_int = int(max_delivery_time)
-                queryset = queryset.filter(details__delivery_time_in_days__lte=max_delivery_time_int).distinct()
+                # Some detail delivers in time iff the fastest one does
+                queryset = queryset.filter(min_delivery_time__lte=max_delivery_time_int)
             except (ValueError, TypeError):
                 raise ValidationError({"max_delivery_time": ["Invalid integer value."]})
         
@@ -218,24 +344,49 @@ class OfferListView(generics.ListCreateAPIView):
     def list(self, request, *args, **kwargs):
         """
         Return paginated response or a consistent results envelope. ValidationError -> 400.
+        Anonymous requests are served from the versioned offer list cache.
         """
+        cache_key = None
+        if not request.user.is_authenticated:
+            cache_key = offer_list_cache_key(request, OFFER_LIST_PARAMS + tuple(self.filterset_fields))
+            cached_data = cache.get(cache_key)
+            record_offer_list_lookup(hit=cached_data is not None)
+            if cached_data is not None:
+                return Response(cached_data, headers={'X-Cache': 'HIT'})
+
+        response = self._list(request)
+        if cache_key is not None and response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, response.data, offer_list_timeout())
+            response['X-Cache'] = 'MISS'
+        return response
+
+    def _list(self, request):
         queryset = self.filter_queryset(self.get_queryset())
+        if use_fast_offer_serialization():
+            projection = OfferProjectionSerializer(request, expand=get_expand_fields(request))
+            queryset = queryset.prefetch_related(None).values(*projection.list_fields())
+            serialize = projection.serialize_list
+        else:
+            serialize = lambda offers: self.get_serializer(offers, many=True).data
+
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
+            return self.get_paginated_response(serialize(page))
+        data = serialize(list(queryset))
         return Response({
-            'count': len(serializer.data),
+            'count': len(data),
             'next': None,
             'previous': None,
-            'results': serializer.data
+            'results': data
         })
 
     def create(self, request, *args, **kwargs):
         """
         Create an offer and return the full offer with details (including IDs) with HTTP 201.
+        A list payload creates all offers at once (see bulk_create).
         """
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
@@ -246,20 +397,65 @@ class OfferListView(generics.ListCreateAPIView):
         headers = self.get_success_headers(response_serializer.data)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    def bulk_create(self, request):
+        """
+        Create a list of offers in one transaction.
 
-class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
+        All items are validated first; any invalid item rejects the whole
+        batch with 400 and a list of per-item errors ({} for valid items).
+        On success the created offers are returned in request order.
+        """
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False,
+            max_length=getattr(settings, 'OFFER_BULK_CREATE_MAX', 100)
+        )
+        serializer.is_valid(raise_exception=True)
+        offers = serializer.save()
+
+        created = Offer.objects.filter(pk__in=[offer.pk for offer in offers]).prefetch_related('details').order_by('id')
+        response_serializer = OfferWithDetailsSerializer(created, many=True)
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+
+class OfferDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a specific offer.
     """
+
+    def get_conditional_state(self):
+        offer_id = self.kwargs.get('pk')
+        updated_at = Offer.objects.filter(pk=offer_id).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        expand = sorted(get_expand_fields(self.request))
+        return ('offer', offer_id, updated_at, expand), updated_at
     
     def get_serializer_class(self):
         if self.request.method in ['PATCH', 'PUT']:
             return OfferUpdateSerializer
         return OfferDetailViewSerializer
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = get_expand_fields(self.request)
+        return context
+
     def get_queryset(self):
+        if 'details' in get_expand_fields(self.request):
+            return Offer.objects.prefetch_related('details')
         return Offer.objects.all()
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve GET from a values() projection when the fast path is enabled.
+        GET has no object-level permission rule, so the instance is not loaded.
+        """
+        if not use_fast_offer_serialization():
+            return super().retrieve(request, *args, **kwargs)
+        projection = OfferProjectionSerializer(request, expand=get_expand_fields(request))
+        offer = get_object_or_404(Offer.objects.values(*projection.detail_fields()), pk=self.kwargs['pk'])
+        return Response(projection.serialize_detail(offer))
+
     def get_permissions(self):
         if self.request.method in ['PATCH', 'PUT', 'DELETE']:
             return [IsAuthenticated(), IsOfferOwner()]
@@ -284,7 +480,7 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
-class OfferDetailDetailView(generics.RetrieveAPIView):
+class OfferDetailDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     Retrieve a specific OfferDetail.
     """
@@ -292,44 +488,151 @@ class OfferDetailDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     queryset = OfferDetail.objects.all()
 
+    def get_conditional_state(self):
+        """
+        Details have no timestamp of their own; every detail write saves the
+        parent offer, so its updated_at is used instead.
+        """
+        detail_id = self.kwargs.get('pk')
+        updated_at = OfferDetail.objects.filter(pk=detail_id).values_list('offer__updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        return ('offerdetail', detail_id, updated_at), updated_at
+
 
-class OrderListView(generics.ListCreateAPIView):
+class OfferDetailBatchView(generics.GenericAPIView):
     """
-    List orders for the current user and create new orders.
+    Retrieve several OfferDetails in one request via ?ids=1,2,3.
+    Unknown ids are reported in `missing` instead of failing the call.
     """
-    serializer_class = OrderSerializer
+    serializer_class = OfferDetailSerializer
     permission_classes = [IsAuthenticated]
+    max_ids = 50
 
-    def get_serializer_class(self):
-        if self.request.method == 'POST':
-            return OrderCreateSerializer
-        return OrderSerializer
+    def get_requested_ids(self):
+        """
+        Parse ?ids= (comma separated and/or repeated), keeping request order.
+        """
+        raw_values = ','.join(self.request.query_params.getlist('ids'))
+        ids = {}
+        for value in raw_values.split(','):
+            value = value.strip()
+            if not value:
+                continue
+            try:
+                ids[int(value)] = None
+            except ValueError:
+                raise ValidationError({"ids": [f"Invalid integer value: {value}."]})
+        ids = list(ids)
+        if not ids:
+            raise ValidationError({"ids": ["This parameter is required."]})
+        if len(ids) > self.max_ids:
+            raise ValidationError({"ids": [f"At most {self.max_ids} ids are allowed per request."]})
+        return ids
+
+    def get(self, request, *args, **kwargs):
+        ids = self.get_requested_ids()
+        details = OfferDetail.objects.in_bulk(ids)
+        serializer = self.get_serializer([details[i] for i in ids if i in details], many=True)
+        return Response({
+            'results': serializer.data,
+            'missing': [i for i in ids if i not in details]
+        }, status=status.HTTP_200_OK)
+
+
+class OrderCursorPagination(CursorPagination):
+    """
+    Keyset pagination for orders, opted into with ?cursor= (empty for the first page).
+    """
+    page_size_query_param = 'page_size'
+    ordering = ('created_at', 'id')
+
+
+class ParticipantOrdersMixin:
+    """
+    Orders the authenticated user takes part in, as customer or business,
+    narrowed by the status, offer_type, created_after and created_before
+    query parameters.
+    """
+
+    def get_order_filters(self):
+        """
+        Translate the query parameters into Order lookups. Invalid values -> 400.
+        """
+        params = self.request.query_params
+        filters = {}
+
+        order_status = params.get('status', '').strip()
+        if order_status:
+            if order_status not in dict(Order.STATUS_CHOICES):
+                raise ValidationError({"status": ["Invalid status. Allowed: in_progress, completed, cancelled."]})
+            filters['status'] = order_status
+
+        offer_type = params.get('offer_type', '').strip()
+        if offer_type:
+            if offer_type not in dict(OfferDetail.OFFER_TYPE_CHOICES):
+                raise ValidationError({"offer_type": ["Invalid offer type. Allowed: basic, standard, premium."]})
+            filters['offer_type'] = offer_type
+
+        created_after = parse_datetime_param(params, 'created_after')
+        if created_after is not None:
+            filters['created_at__gte'] = created_after
+
+        created_before = parse_datetime_param(params, 'created_before', end_of_day=True)
+        if created_before is not None:
+            filters['created_at__lt'] = created_before
+
+        return filters
 
     def get_queryset(self):
         """
         Return only orders related to the authenticated user.
+
+        The customer/business OR is built as a UNION of two queries, each
+        served by its (participant, created_at) index, instead of an OR that
+        forces a full scan. Both profiles are joined up front (only their
+        username_id is serialized, so auth_user is not joined).
         """
         user = self.request.user
+        filters = self.get_order_filters()
+        as_customer = Order.objects.filter(customer_user__username_id=user.id, **filters).values('id')
+        as_business = Order.objects.filter(business_user__username_id=user.id, **filters).values('id')
         return Order.objects.filter(
-            Q(customer_user__username=user) | Q(business_user__username=user)
-        )
+            id__in=as_customer.union(as_business)
+        ).select_related('customer_user', 'business_user').order_by('created_at', 'id')
+
+
+class OrderListView(ParticipantOrdersMixin, generics.ListCreateAPIView):
+    """
+    List orders for the current user and create new orders.
+
+    Returns a plain array by default, or a cursor-paginated
+    {next, previous, results} envelope when ?cursor= is given.
+    Filters: status, offer_type, created_after, created_before.
+    """
+    serializer_class = OrderSerializer
+    permission_classes = [IsAuthenticated]
+    # Filtering happens in get_queryset so it can be pushed into both UNION branches
+    filter_backends = []
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if OrderCursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = OrderCursorPagination()
+            else:
+                self._paginator = None
+        return self._paginator
+
+    def get_serializer_class(self):
+        if self.request.method == 'POST':
+            return OrderCreateSerializer
+        return OrderSerializer
 
     def get_permissions(self):
         if self.request.method == 'POST':
             return [IsAuthenticated(), IsCustomerUser()]
         return [IsAuthenticated()]
-    
-    def list(self, request, *args, **kwargs):
-        """
-        Always return an array (empty on errors) for consistency.
-        """
-        try:
-            queryset = self.filter_queryset(self.get_queryset())
-            serializer = self.get_serializer(queryset, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            # On error return an empty array
-            return Response([], status=status.HTTP_200_OK)
 
     def create(self, request, *args, **kwargs):
         """
@@ -358,6 +661,163 @@ class OrderListView(generics.ListCreateAPIView):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+class OrderChangesView(generics.GenericAPIView):
+    """
+    Incremental change feed of the current user's orders.
+
+    Returns events with a sequence number greater than ?since= (default 0),
+    at most ?limit= (default 100, max 500) per call, plus the cursor to
+    pass as `since` on the next poll. Events appear once settled (see
+    OrderEvent.settled()), so the cursor never skips a late commit.
+    """
+    serializer_class = OrderEventSerializer
+    permission_classes = [IsAuthenticated]
+    default_limit = 100
+    max_limit = 500
+
+    def get_int_param(self, name, default, minimum):
+        value = self.request.query_params.get(name, '').strip()
+        if not value:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: ["Invalid integer value."]})
+        if value < minimum:
+            raise ValidationError({name: [f"Must be at least {minimum}."]})
+        return value
+
+    def get(self, request, *args, **kwargs):
+        since = self.get_int_param('since', 0, 0)
+        limit = min(self.get_int_param('limit', self.default_limit, 1), self.max_limit)
+
+        profile = get_request_profile(request)
+        events = list(
+            OrderEvent.settled().filter(
+                Q(customer_user_id=profile) | Q(business_user_id=profile), id__gt=since
+            ).order_by('id')[:limit + 1]
+        )
+        has_more = len(events) > limit
+        events = events[:limit]
+        return Response({
+            'events': self.get_serializer(events, many=True).data,
+            'next_cursor': events[-1].id if events else since,
+            'has_more': has_more
+        }, status=status.HTTP_200_OK)
+
+
+class OrderExportView(ParticipantOrdersMixin, generics.GenericAPIView):
+    """
+    Stream the user's full order history as CSV or NDJSON.
+
+    Same scoping and filters as the order list, oldest first.
+    """
+    permission_classes = [IsAuthenticated]
+    filter_backends = []
+    content_negotiation_class = ExportContentNegotiation
+
+    def get(self, request, export_format):
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+        return streaming_export(request, self.get_queryset(), ORDER_EXPORT_FIELDS, export_format, 'orders')
+
+
+class OrderStreamView(View):
+    """
+    Server-Sent Events stream of the current user's order events (ASGI only).
+
+    Authenticates like the rest of the API (`Authorization: Token <key>` or
+    `Bearer <access token>`). EventSource clients, which cannot send headers,
+    pass a short-lived signed access token as `?access_token=`; permanent
+    tokens are not accepted in the URL, where they would end up in logs.
+    Resumes after `Last-Event-ID` (or `?last_event_id=`), otherwise starts
+    with new events. Sends a comment line as heartbeat and refuses new
+    streams with 503 once the per-worker cap is reached.
+    """
+    batch_size = 100
+
+    def get_authenticators(self):
+        return [auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+
+    def authenticate(self, request):
+        """
+        Resolve the credentials to the user's profile id, or None.
+        Raises AuthenticationFailed for invalid credentials.
+        """
+        access_token = request.GET.get('access_token')
+        if access_token and 'Authorization' not in request.headers:
+            if not signed_tokens_enabled():
+                return None
+            user, _ = SignedTokenAuthentication().authenticate_credentials(access_token)
+        else:
+            for authenticator in self.get_authenticators():
+                user_auth = authenticator.authenticate(request)
+                if user_auth is not None:
+                    user = user_auth[0]
+                    break
+            else:
+                return None
+        try:
+            return user.profile.id
+        except Profile.DoesNotExist:
+            return None
+
+    def get_last_event_id(self, request):
+        value = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        try:
+            return int(value) if value else None
+        except ValueError:
+            return None
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            profile_id = await sync_to_async(self.authenticate)(request)
+        except AuthenticationFailed as exc:
+            return JsonResponse({'detail': str(exc.detail)}, status=401)
+        if profile_id is None:
+            return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+        last_event_id = self.get_last_event_id(request)
+        if last_event_id is None:
+            last_event_id = await OrderEvent.settled().order_by('-id').values_list('id', flat=True).afirst() or 0
+
+        subscription = broker.subscribe(profile_id)
+        if subscription is None:
+            return JsonResponse({'detail': 'Too many open streams, retry later.'}, status=503)
+
+        response = StreamingHttpResponse(
+            self.stream(subscription, profile_id, last_event_id), content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def stream(self, subscription, profile_id, last_event_id):
+        renderer = FastJSONRenderer()
+        interval = heartbeat_interval()
+        try:
+            yield f'retry: {interval * 1000}\n\n'
+            while True:
+                events = [
+                    event async for event in OrderEvent.settled().filter(
+                        Q(customer_user_id=profile_id) | Q(business_user_id=profile_id), id__gt=last_event_id
+                    ).order_by('id')[:self.batch_size]
+                ]
+                for event in events:
+                    data = renderer.render(OrderEventSerializer(event).data).decode()
+                    yield f'id: {event.id}\nevent: {event.event_type}\ndata: {data}\n\n'
+                    last_event_id = event.id
+                if len(events) == self.batch_size:
+                    continue
+                if await subscription.wait(interval):
+                    # The committed event only becomes readable once settled
+                    await asyncio.sleep(order_event_settle_seconds())
+                else:
+                    yield ': heartbeat\n\n'
+        finally:
+            broker.unsubscribe(subscription)
+
+
 class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a specific order.
@@ -407,32 +867,54 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
         self.check_object_permissions(request, instance)
         self.perform_update(serializer)
 
-        response_serializer = OrderSerializer(instance)
+        response_serializer = OrderSerializer(serializer.instance)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+def business_profile_candidates(business_user_id):
+    """
+    Business profiles matching an id that may be either Profile.id
+    (preferred by some clients) or User.id.
+    """
+    return Profile.objects.filter(
+        Q(id=business_user_id) | Q(username_id=business_user_id), type='business'
+    )
+
+
+def pick_business_profile(rows, business_user_id):
+    """
+    Choose the row matched by Profile.id over the one matched by User.id.
+    Raises 404 if nothing matched.
+    """
+    rows = list(rows)
+    if not rows:
+        raise Http404('No Profile matches the given query.')
+    return next((row for row in rows if row['id'] == business_user_id), rows[0])
+
+
+def get_business_order_count(business_user_id, order_status):
+    """
+    Read the order counter of a business user in a single query.
+    """
+    counter = BusinessOrderCounter.objects.filter(
+        business_user=OuterRef('pk'), status=order_status
+    ).values('count')
+    candidates = business_profile_candidates(business_user_id).annotate(
+        order_count=Coalesce(Subquery(counter), Value(0))
+    ).values('id', 'order_count')
+    return pick_business_profile(candidates, business_user_id)['order_count']
+
+
 class OrderCountView(generics.RetrieveAPIView):
     """
     Return number of in-progress orders for a given business user.
     """
     serializer_class = OrderCountSerializer
     permission_classes = [IsAuthenticated]
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [FastJSONRenderer]
 
     def get_object(self):
-        business_user_id = self.kwargs.get('business_user_id')
-        # Accept either Profile.id (preferred by some clients) or User.id
-        profile = Profile.objects.filter(id=business_user_id, type='business').first()
-        if profile is None:
-            business_user = get_object_or_404(User, id=business_user_id)
-            profile = get_object_or_404(Profile, username=business_user, type='business')
-
-        order_count = Order.objects.filter(
-            business_user=profile,
-            status='in_progress'
-        ).count()
-
-        return {'order_count': order_count}
+        return {'order_count': get_business_order_count(self.kwargs.get('business_user_id'), 'in_progress')}
 
 
 class CompletedOrderCountView(generics.RetrieveAPIView):
@@ -441,25 +923,67 @@ class CompletedOrderCountView(generics.RetrieveAPIView):
     """
     serializer_class = CompletedOrderCountSerializer
     permission_classes = [IsAuthenticated]
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [FastJSONRenderer]
+
+    def get_object(self):
+        return {'completed_order_count': get_business_order_count(self.kwargs.get('business_user_id'), 'completed')}
+
+
+class BusinessStatsView(generics.RetrieveAPIView):
+    """
+    Return order, revenue, offer and rating statistics for a business user.
+
+    Computed in two queries (profile with precomputed rating stats, then
+    conditional aggregation over orders) and cached per business; order,
+    offer and review writes invalidate the entry.
+    """
+    serializer_class = BusinessStatsSerializer
+    permission_classes = [IsAuthenticated]
 
     def get_object(self):
         business_user_id = self.kwargs.get('business_user_id')
-        # Accept either Profile.id or User.id
-        profile = Profile.objects.filter(id=business_user_id, type='business').first()
-        if profile is None:
-            business_user = get_object_or_404(User, id=business_user_id)
-            profile = get_object_or_404(Profile, username=business_user, type='business')
+        offer_count = Offer.objects.filter(user=OuterRef('pk')).order_by().values('user').annotate(
+            total=Count('id')
+        ).values('total')
+        rating_fields = ['rating_stats__review_count', 'rating_stats__rating_sum'] + [
+            f'rating_stats__rating_{rating}' for rating in range(1, 6)
+        ]
+        candidates = business_profile_candidates(business_user_id).annotate(
+            offer_count=Coalesce(Subquery(offer_count), Value(0)),
+        ).values('id', 'username_id', 'offer_count', *rating_fields)
+        profile = pick_business_profile(candidates, business_user_id)
+        ratings = {field.split('__')[1]: profile[field] or 0 for field in rating_fields}
+
+        orders = Order.objects.filter(business_user_id=profile['id']).aggregate(
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            completed=Count('id', filter=Q(status='completed')),
+            cancelled=Count('id', filter=Q(status='cancelled')),
+            revenue=Sum('price', filter=Q(status='completed')),
+        )
 
-        completed_order_count = Order.objects.filter(
-            business_user=profile,
-            status='completed'
-        ).count()
+        review_count = ratings['review_count']
+        return {
+            'business_user': profile['username_id'],
+            'in_progress_order_count': orders['in_progress'],
+            'completed_order_count': orders['completed'],
+            'cancelled_order_count': orders['cancelled'],
+            'total_revenue': orders['revenue'] or Decimal('0'),
+            'offer_count': profile['offer_count'],
+            'review_count': review_count,
+            'average_rating': round(ratings['rating_sum'] / review_count, 1) if review_count else 0.0,
+            'rating_histogram': {str(rating): ratings[f'rating_{rating}'] for rating in range(1, 6)},
+        }
 
-        return {'completed_order_count': completed_order_count}
+    def retrieve(self, request, *args, **kwargs):
+        cache_key = business_stats_cache_key(self.kwargs.get('business_user_id'))
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache.set(cache_key, data, business_stats_timeout())
+        return Response(data)
 
 
-class ReviewListView(generics.ListCreateAPIView):
+class ReviewListView(ConditionalGetMixin, generics.ListCreateAPIView):
     """
     List reviews (with filtering and ordering) and create new reviews.
     """
@@ -469,6 +993,20 @@ class ReviewListView(generics.ListCreateAPIView):
     ordering_fields = ['updated_at', 'rating']
     ordering = ['-updated_at']
 
+    def get_conditional_state(self):
+        """
+        Validate against max(updated_at) and count of the filtered reviews,
+        computed in a single aggregate query. Invalid filter values skip
+        validation and are left to list().
+        """
+        try:
+            queryset = self.filter_queryset(self.get_queryset())
+        except ValidationError:
+            return None
+        state = queryset.aggregate(last_updated=Max('updated_at'), count=Count('id'))
+        params = sorted(self.request.query_params.lists())
+        return ('reviews', params, state['last_updated'], state['count']), state['last_updated']
+
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return ReviewCreateSerializer
@@ -528,6 +1066,26 @@ class ReviewListView(generics.ListCreateAPIView):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+class ReviewExportView(generics.GenericAPIView):
+    """
+    Stream the reviews the user wrote or received as CSV or NDJSON, oldest first.
+    """
+    permission_classes = [IsAuthenticated]
+    filter_backends = []
+    content_negotiation_class = ExportContentNegotiation
+
+    def get_queryset(self):
+        user = self.request.user
+        return Review.objects.filter(
+            Q(business_user__username_id=user.id) | Q(reviewer__username_id=user.id)
+        ).order_by('created_at', 'id')
+
+    def get(self, request, export_format):
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+        return streaming_export(request, self.get_queryset(), REVIEW_EXPORT_FIELDS, export_format, 'reviews')
+
+
 class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a specific review.
@@ -561,7 +1119,7 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
-        response_serializer = ReviewSerializer(instance)
+        response_serializer = ReviewSerializer(serializer.instance)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
@@ -574,29 +1132,24 @@ class BaseInfoView(generics.RetrieveAPIView):
 
     def get_object(self):
         """
-        Compute and return platform aggregates.
+        Read the precomputed platform aggregates in a single query.
         """
-        # Number of reviews
-        review_count = Review.objects.count()
-        
+        stats = PlatformStats.objects.filter(pk=PLATFORM_STATS_ID).values(
+            'review_count', 'rating_sum', 'business_profile_count', 'offer_count'
+        ).first()
+        if stats is None:
+            rebuild_platform_stats()
+            return self.get_object()
+
         # Average rating rounded to one decimal
-        avg_rating_result = Review.objects.aggregate(avg_rating=Avg('rating'))
-        average_rating = avg_rating_result['avg_rating']
-        if average_rating is not None:
-            # Round to one decimal place
-            average_rating = round(float(average_rating), 1)
+        if stats['review_count']:
+            average_rating = round(stats['rating_sum'] / stats['review_count'], 1)
         else:
             average_rating = 0.0
         
-        # Number of business profiles
-        business_profile_count = Profile.objects.filter(type='business').count()
-        
-        # Number of offers
-        offer_count = Offer.objects.count()
-        
         return {
-            'review_count': review_count,
+            'review_count': stats['review_count'],
             'average_rating': average_rating,
-            'business_profile_count': business_profile_count,
-            'offer_count': offer_count
+            'business_profile_count': stats['business_profile_count'],
+            'offer_count': stats['offer_count']
         }
@@ -0,0 +1,118 @@
+"""
+Response caching helpers.
+
+Business statistics are cached per business and deleted on writes. Cached
+offer list pages are keyed on a generation counter. Any offer write
+bumps the counter, which orphans every cached page at once without having
+to find or delete keys; orphaned entries simply expire.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+OFFER_LIST_VERSION_KEY = 'offer-list:version'
+OFFER_LIST_HITS_KEY = 'offer-list:hits'
+OFFER_LIST_MISSES_KEY = 'offer-list:misses'
+
+# Query parameters OfferListView reads itself; its filterset_fields are added
+# by the view. Everything else is ignored
+OFFER_LIST_PARAMS = (
+    'creator_id', 'min_price', 'max_delivery_time', 'search',
+    'ordering', 'page', 'page_size', 'cursor', 'expand',
+)
+
+
+def offer_list_timeout():
+    return getattr(settings, 'OFFER_LIST_CACHE_TIMEOUT', 60)
+
+
+def get_offer_list_version():
+    """
+    Return the current generation of the offer list cache.
+    """
+    version = cache.get(OFFER_LIST_VERSION_KEY)
+    if version is None:
+        # Never restart at a previously used value after eviction
+        version = time.time_ns()
+        cache.add(OFFER_LIST_VERSION_KEY, version, timeout=None)
+        version = cache.get(OFFER_LIST_VERSION_KEY, version)
+    return version
+
+
+def bump_offer_list_version():
+    """
+    Invalidate every cached offer list page in O(1).
+    """
+    try:
+        cache.incr(OFFER_LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(OFFER_LIST_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def offer_list_cache_key(request, param_names=OFFER_LIST_PARAMS):
+    """
+    Build the cache key for a request from the query parameters the view
+    reads. Blank values are kept (an empty ?cursor= switches to keyset
+    pagination), and scheme and host are included because cached pages
+    contain absolute URLs.
+    """
+    params = [
+        (name, request.query_params.getlist(name))
+        for name in sorted(set(param_names))
+        if name in request.query_params
+    ]
+    origin = f'{request.scheme}://{request.get_host()}'
+    digest = hashlib.sha1(repr((origin, params)).encode()).hexdigest()
+    return f'offer-list:{get_offer_list_version()}:{digest}'
+
+
+def record_offer_list_lookup(hit):
+    """
+    Count a cache hit or miss.
+    """
+    key = OFFER_LIST_HITS_KEY if hit else OFFER_LIST_MISSES_KEY
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def offer_list_cache_stats():
+    """
+    Return hit/miss counters of the offer list cache.
+    """
+    hits = cache.get(OFFER_LIST_HITS_KEY, 0)
+    misses = cache.get(OFFER_LIST_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 3) if total else 0.0,
+        'version': get_offer_list_version(),
+    }
+
+
+def business_stats_timeout():
+    return getattr(settings, 'BUSINESS_STATS_CACHE_TIMEOUT', 300)
+
+
+def business_stats_cache_key(business_user_id):
+    return f'business-stats:{business_user_id}'
+
+
+def invalidate_business_stats(profile_id):
+    """
+    Drop cached statistics of a business. The endpoint accepts Profile.id
+    and User.id, so entries under both ids are removed.
+    """
+    from coderr_app.models import Profile
+
+    user_id = Profile.objects.filter(pk=profile_id).values_list('username_id', flat=True).first()
+    keys = [business_stats_cache_key(profile_id)]
+    if user_id is not None:
+        keys.append(business_stats_cache_key(user_id))
+    cache.delete_many(keys)
@@ -0,0 +1,154 @@
+"""
+Maintenance of denormalized counter tables: order counts per business,
+rating aggregates per business and the platform-wide stats row.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+
+from coderr_app.models import (
+    Profile, Offer, Order, Review, BusinessOrderCounter, BusinessRatingStats, PlatformStats
+)
+
+
+PLATFORM_STATS_ID = 1
+RATINGS = range(1, 6)
+
+
+def _increment(model, lookup, deltas, create=True):
+    """
+    Add `deltas` to the row matching `lookup` with F() expressions. When no
+    row exists and `create` is set, the row is created holding the deltas.
+    """
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    if model.objects.filter(**lookup).update(**updates) or not create:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **deltas)
+    except IntegrityError:
+        # Created concurrently, fall back to the F() update
+        model.objects.filter(**lookup).update(**updates)
+
+
+def adjust_order_counter(business_user_id, status, delta):
+    """
+    Atomically add `delta` to the counter of a business user and status.
+    Missing rows are created on increments only.
+    """
+    _increment(
+        BusinessOrderCounter, {'business_user_id': business_user_id, 'status': status},
+        {'count': delta}, create=delta > 0
+    )
+
+
+def move_order_counter(business_user_id, old_status, new_status):
+    """
+    Move one order from `old_status` to `new_status`.
+    """
+    if old_status == new_status:
+        return
+    adjust_order_counter(business_user_id, old_status, -1)
+    adjust_order_counter(business_user_id, new_status, 1)
+
+
+def rebuild_order_counters():
+    """
+    Recompute all counters from the orders table. Returns the number of rows written.
+    """
+    rows = (
+        Order.objects.values('business_user_id', 'status')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    with transaction.atomic():
+        BusinessOrderCounter.objects.all().delete()
+        counters = BusinessOrderCounter.objects.bulk_create([
+            BusinessOrderCounter(business_user_id=row['business_user_id'], status=row['status'], count=row['total'])
+            for row in rows
+        ])
+    return len(counters)
+
+
+def adjust_platform_stats(**deltas):
+    """
+    Apply deltas to the platform stats row, recomputing it if it is missing.
+    """
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    if not PlatformStats.objects.filter(pk=PLATFORM_STATS_ID).update(**updates):
+        rebuild_platform_stats()
+
+
+def rating_deltas(rating, sign):
+    """
+    Field deltas for adding (sign=1) or removing (sign=-1) one rating.
+    """
+    deltas = {'review_count': sign, 'rating_sum': sign * rating}
+    if rating in RATINGS:
+        deltas[f'rating_{rating}'] = sign
+    return deltas
+
+
+def add_review_to_stats(review, sign=1):
+    """
+    Count a created (sign=1) or deleted (sign=-1) review.
+    """
+    _increment(
+        BusinessRatingStats, {'business_user_id': review.business_user_id},
+        rating_deltas(review.rating, sign), create=sign > 0
+    )
+    adjust_platform_stats(review_count=sign, rating_sum=sign * review.rating)
+
+
+def change_review_rating(business_user_id, old_rating, new_rating):
+    """
+    Move one review from `old_rating` to `new_rating`.
+    """
+    if old_rating == new_rating:
+        return
+    deltas = rating_deltas(new_rating, 1)
+    for field, delta in rating_deltas(old_rating, -1).items():
+        deltas[field] = deltas.get(field, 0) + delta
+    _increment(BusinessRatingStats, {'business_user_id': business_user_id}, deltas)
+    adjust_platform_stats(rating_sum=new_rating - old_rating)
+
+
+def compute_platform_stats():
+    """
+    Full recompute of the platform stats values.
+    """
+    reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    return {
+        'review_count': reviews['review_count'],
+        'rating_sum': reviews['rating_sum'] or 0,
+        'business_profile_count': Profile.objects.filter(type='business').count(),
+        'offer_count': Offer.objects.count(),
+    }
+
+
+def compute_rating_stats():
+    """
+    Full recompute of the per-business rating values, keyed by profile id.
+    """
+    histogram = {f'rating_{rating}': Count('id', filter=Q(rating=rating)) for rating in RATINGS}
+    rows = Review.objects.values('business_user_id').annotate(
+        review_count=Count('id'), rating_sum=Sum('rating'), **histogram
+    ).order_by()
+    return {row.pop('business_user_id'): row for row in rows}
+
+
+def rebuild_platform_stats():
+    values = compute_platform_stats()
+    PlatformStats.objects.update_or_create(pk=PLATFORM_STATS_ID, defaults=values)
+
+
+def rebuild_rating_stats():
+    """
+    Recompute all per-business rating rows. Returns the number of rows written.
+    """
+    with transaction.atomic():
+        BusinessRatingStats.objects.all().delete()
+        rows = BusinessRatingStats.objects.bulk_create([
+            BusinessRatingStats(business_user_id=business_user_id, **values)
+            for business_user_id, values in compute_rating_stats().items()
+        ])
+    return len(rows)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from coderr_app.models import Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    """
+    Recompute Offer.min_price and Offer.min_delivery_time from offer details.
+
+    Used to backfill existing rows and to repair offers whose details were
+    written outside the offer serializers.
+    """
+    help = 'Recompute min_price and min_delivery_time for all offers.'
+
+    def handle(self, *args, **options):
+        details = OfferDetail.objects.filter(offer=OuterRef('pk')).values('offer')
+        updated = Offer.objects.update(
+            min_price=Coalesce(
+                Subquery(details.annotate(value=Min('price')).values('value')),
+                Value(0),
+            ),
+            min_delivery_time=Coalesce(
+                Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+                Value(0),
+            ),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Updated {updated} offers.'))
@@ -0,0 +1,74 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from coderr_app.api.renderers import FastJSONRenderer, orjson
+from coderr_app.api.serializers import OrderSerializer
+from coderr_app.models import Profile, Offer, OfferDetail, Order
+
+
+class Command(BaseCommand):
+    """
+    Compare DRF's JSONRenderer with FastJSONRenderer on a large order list.
+
+    Orders are created inside a transaction that is rolled back afterwards.
+    """
+    help = 'Benchmark render time and size of OrderSerializer lists per JSON renderer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed, FastJSONRenderer uses the stdlib fallback.'))
+        with transaction.atomic():
+            data = OrderSerializer(self.create_orders(options['orders']), many=True).data
+            transaction.set_rollback(True)
+
+        results = {}
+        for renderer in (JSONRenderer(), FastJSONRenderer()):
+            name = type(renderer).__name__
+            output = renderer.render(data)
+            results[name] = output
+            elapsed = self.best_of(lambda: renderer.render(data), options['repeat'])
+            self.stdout.write(f'{name:>18}: {elapsed * 1000:8.2f} ms  {len(output):>10} bytes')
+
+        if results['JSONRenderer'] != results['FastJSONRenderer']:
+            raise CommandError('Renderers produced different output.')
+
+    def create_orders(self, count):
+        business = User.objects.create(username='benchmark_business', email='benchmark-business@coderr.de')
+        customer = User.objects.create(username='benchmark_customer', email='benchmark-customer@coderr.de')
+        business_profile = Profile.objects.create(username=business, email=business.email, type='business')
+        customer_profile = Profile.objects.create(username=customer, email=customer.email, type='customer')
+        offer = Offer.objects.create(user=business_profile, title='Benchmark', description='Benchmark offer')
+        detail = OfferDetail.objects.create(
+            offer=offer, title='Premium Paket', revisions=3, delivery_time_in_days=7,
+            price='1499.99', features=['Logo Design', 'Visitenkarten', 'Briefpapier'], offer_type='premium'
+        )
+        Order.objects.bulk_create([
+            Order(
+                customer_user=customer_profile, business_user=business_profile, offer_detail=detail,
+                title=detail.title, revisions=detail.revisions,
+                delivery_time_in_days=detail.delivery_time_in_days, price=detail.price,
+                features=detail.features, offer_type=detail.offer_type
+            )
+            for _ in range(count)
+        ])
+        return list(Order.objects.filter(business_user=business_profile).select_related(
+            'customer_user__username', 'business_user__username'
+        ))
+
+    @staticmethod
+    def best_of(func, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
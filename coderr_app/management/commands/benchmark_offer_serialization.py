@@ -0,0 +1,81 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from coderr_app.api.fast_serializers import OfferProjectionSerializer
+from coderr_app.api.serializers import OfferListSerializer
+from coderr_app.models import Profile, Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    """
+    Compare OfferListSerializer with the values() fast path.
+
+    Creates throwaway offers inside a transaction that is rolled back,
+    checks both paths render identical JSON, then times each of them.
+    """
+    help = 'Check parity and benchmark the offer list fast serialization path.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[6, 100, 1000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_offers(max(options['sizes']))
+            for size in options['sizes']:
+                self.run(size, options['repeat'])
+            transaction.set_rollback(True)
+
+    def create_offers(self, count):
+        user = User.objects.create(username='benchmark_business', email='benchmark@coderr.de')
+        profile = Profile.objects.create(username=user, email=user.email, type='business', first_name='Bench')
+        offers = Offer.objects.bulk_create([
+            Offer(user=profile, title=f'Offer {i}', description='Benchmark offer', min_price=100, min_delivery_time=3)
+            for i in range(count)
+        ])
+        OfferDetail.objects.bulk_create([
+            OfferDetail(offer=offer, title=offer_type, revisions=1, delivery_time_in_days=3 + n,
+                        price=100 * (n + 1), features=['a', 'b'], offer_type=offer_type)
+            for offer in offers
+            for n, offer_type in enumerate(['basic', 'standard', 'premium'])
+        ])
+
+    def run(self, size, repeat):
+        # The default testserver host is not in ALLOWED_HOSTS
+        request = Request(APIRequestFactory().get('/api/offers/', SERVER_NAME='localhost'))
+        renderer = JSONRenderer()
+
+        def drf():
+            offers = list(Offer.objects.select_related('user__username').prefetch_related('details').order_by('-id')[:size])
+            return renderer.render(OfferListSerializer(offers, many=True, context={'request': request}).data)
+
+        def fast():
+            projection = OfferProjectionSerializer(request)
+            offers = list(Offer.objects.order_by('-id').values(*projection.list_fields())[:size])
+            return renderer.render(projection.serialize_list(offers))
+
+        if drf() != fast():
+            raise CommandError(f'Fast path output differs from OfferListSerializer at {size} offers.')
+
+        timings = {name: self.best_of(func, repeat) for name, func in (('drf', drf), ('fast', fast))}
+        self.stdout.write(
+            f"{size:>5} offers: drf {timings['drf'] * 1000:8.2f} ms  "
+            f"fast {timings['fast'] * 1000:8.2f} ms  "
+            f"speedup {timings['drf'] / timings['fast']:5.1f}x"
+        )
+
+    @staticmethod
+    def best_of(func, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
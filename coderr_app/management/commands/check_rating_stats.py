@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from coderr_app.counters import (
+    PLATFORM_STATS_ID, compute_platform_stats, compute_rating_stats,
+    rebuild_platform_stats, rebuild_rating_stats
+)
+from coderr_app.models import BusinessRatingStats, PlatformStats
+
+
+class Command(BaseCommand):
+    """
+    Diff the incrementally maintained rating and platform stats against a
+    full recompute, optionally repairing them.
+    """
+    help = 'Check BusinessRatingStats and PlatformStats against a full recompute.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Rebuild the stats if differences are found.')
+
+    def handle(self, *args, **options):
+        differences = self.diff_platform_stats() + self.diff_rating_stats()
+        for difference in differences:
+            self.stdout.write(self.style.WARNING(difference))
+
+        if not differences:
+            self.stdout.write(self.style.SUCCESS('Stats are consistent.'))
+            return
+        if options['fix']:
+            rebuild_platform_stats()
+            written = rebuild_rating_stats()
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt platform stats and {written} business rating rows.'))
+            return
+        raise CommandError(f'{len(differences)} differences found, rerun with --fix to rebuild.')
+
+    def diff_platform_stats(self):
+        expected = compute_platform_stats()
+        stored = PlatformStats.objects.filter(pk=PLATFORM_STATS_ID).values(*expected).first()
+        if stored is None:
+            return ['platform: stats row is missing']
+        return [
+            f'platform: {field} stored={stored[field]} expected={value}'
+            for field, value in expected.items() if stored[field] != value
+        ]
+
+    def diff_rating_stats(self):
+        expected = compute_rating_stats()
+        fields = ['review_count', 'rating_sum'] + [f'rating_{rating}' for rating in range(1, 6)]
+        stored = {
+            row.pop('business_user_id'): row
+            for row in BusinessRatingStats.objects.values('business_user_id', *fields)
+        }
+        empty = dict.fromkeys(fields, 0)
+        differences = []
+        for business_user_id in sorted(set(expected) | set(stored)):
+            stored_values = stored.get(business_user_id, empty)
+            expected_values = expected.get(business_user_id, empty)
+            for field in fields:
+                if stored_values[field] != expected_values[field]:
+                    differences.append(
+                        f'business {business_user_id}: {field} '
+                        f'stored={stored_values[field]} expected={expected_values[field]}'
+                    )
+        return differences
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from coderr_app.caching import offer_list_cache_stats
+
+
+class Command(BaseCommand):
+    """
+    Print hit/miss counters of the anonymous offer list cache.
+    """
+    help = 'Show hit/miss counters of the offer list response cache.'
+
+    def handle(self, *args, **options):
+        stats = offer_list_cache_stats()
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} "
+            f"hit_ratio={stats['hit_ratio']} version={stats['version']}"
+        )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from coderr_app.counters import rebuild_order_counters
+
+
+class Command(BaseCommand):
+    """
+    Recompute BusinessOrderCounter rows from the orders table.
+    """
+    help = 'Rebuild the per-business order counters from scratch.'
+
+    def handle(self, *args, **options):
+        written = rebuild_order_counters()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} order counters.'))
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.2 on 2026-10-18 17:06
+
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_offer_aggregates(apps, schema_editor):
+    """
+    Fill the new columns of existing offers from their details (same
+    computation as the backfill_offer_aggregates command).
+    """
+    Offer = apps.get_model('coderr_app', 'Offer')
+    OfferDetail = apps.get_model('coderr_app', 'OfferDetail')
+    details = OfferDetail.objects.filter(offer=OuterRef('pk')).values('offer')
+    Offer.objects.update(
+        min_price=Coalesce(Subquery(details.annotate(value=Min('price')).values('value')), Value(0)),
+        min_delivery_time=Coalesce(
+            Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')), Value(0)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.DecimalField(db_index=True, decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.RunPython(backfill_offer_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Create the full-text index for the current backend and fill it from
+    existing offers (SQLite: FTS5 table, PostgreSQL: generated tsvector column).
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS coderr_app_offer_search "
+            "USING fts5(title, description)"
+        )
+        schema_editor.execute(
+            "INSERT INTO coderr_app_offer_search (rowid, title, description) "
+            "SELECT id, title, description FROM coderr_app_offer"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            "ALTER TABLE coderr_app_offer ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', "
+            "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"
+        )
+        schema_editor.execute(
+            "CREATE INDEX coderr_app_offer_search_gin "
+            "ON coderr_app_offer USING GIN (search_vector)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS coderr_app_offer_search")
+    elif vendor == 'postgresql':
+        schema_editor.execute("ALTER TABLE coderr_app_offer DROP COLUMN IF EXISTS search_vector")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0002_offer_min_price_min_delivery_time'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
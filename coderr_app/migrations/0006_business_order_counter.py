@@ -0,0 +1,38 @@
+# Generated by Django 5.2.2 on 2026-10-18 17:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_order_counters(apps, schema_editor):
+    Order = apps.get_model('coderr_app', 'Order')
+    BusinessOrderCounter = apps.get_model('coderr_app', 'BusinessOrderCounter')
+    rows = Order.objects.values('business_user_id', 'status').annotate(total=Count('id')).order_by()
+    BusinessOrderCounter.objects.bulk_create([
+        BusinessOrderCounter(business_user_id=row['business_user_id'], status=row['status'], count=row['total'])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0005_profile_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_counters', to='coderr_app.profile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business_user', 'status'), name='unique_business_order_status')],
+            },
+        ),
+        migrations.RunPython(fill_order_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.2 on 2026-10-18 17:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def fill_stats(apps, schema_editor):
+    Profile = apps.get_model('coderr_app', 'Profile')
+    Offer = apps.get_model('coderr_app', 'Offer')
+    Review = apps.get_model('coderr_app', 'Review')
+    PlatformStats = apps.get_model('coderr_app', 'PlatformStats')
+    BusinessRatingStats = apps.get_model('coderr_app', 'BusinessRatingStats')
+
+    reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    PlatformStats.objects.create(
+        pk=1,
+        review_count=reviews['review_count'],
+        rating_sum=reviews['rating_sum'] or 0,
+        business_profile_count=Profile.objects.filter(type='business').count(),
+        offer_count=Offer.objects.count(),
+    )
+
+    histogram = {f'rating_{rating}': Count('id', filter=Q(rating=rating)) for rating in range(1, 6)}
+    rows = Review.objects.values('business_user_id').annotate(
+        review_count=Count('id'), rating_sum=Sum('rating'), **histogram
+    ).order_by()
+    BusinessRatingStats.objects.bulk_create([BusinessRatingStats(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0006_business_order_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRatingStats',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_stats', serialize=False, to='coderr_app.profile')),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('rating_1', models.IntegerField(default=0)),
+                ('rating_2', models.IntegerField(default=0)),
+                ('rating_3', models.IntegerField(default=0)),
+                ('rating_4', models.IntegerField(default=0)),
+                ('rating_5', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PlatformStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('business_profile_count', models.IntegerField(default=0)),
+                ('offer_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(fill_stats, migrations.RunPython.noop),
+    ]
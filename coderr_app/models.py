@@ -1,5 +1,15 @@
-from django.db import models
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, models
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+
+def order_event_settle_seconds():
+    # SQLite serializes writers, so event ids always commit in order there
+    default = 0 if connection.vendor == 'sqlite' else 5
+    return getattr(settings, 'ORDER_EVENT_SETTLE_SECONDS', default)
 
 
 class Profile(models.Model):
@@ -26,6 +36,12 @@ class Profile(models.Model):
     type = models.CharField(max_length=255, choices=TYPE_CHOICES)
     email = models.EmailField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['type'], name='profile_type_idx'),
+        ]
 
     def __str__(self):
         """String representation of the profile."""
@@ -45,36 +61,35 @@ class Offer(models.Model):
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, default=0, db_index=True)
+    min_delivery_time = models.IntegerField(default=0, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='offer_updated_at_idx'),
+        ]
 
     def __str__(self):
         """String representation of the offer."""
         return f"{self.title} by {self.user.username.username}"
 
-    @property
-    def min_price(self):
+    def refresh_detail_aggregates(self):
         """
-        Compute minimal price across all offer details.
-        
-        Returns:
-            Decimal: Lowest price among details or 0 if none exist
-        """
-        details = self.details.all()
-        if details.exists():
-            return min(detail.price for detail in details)
-        return 0
+        Recompute min_price and min_delivery_time from the current details.
 
-    @property
-    def min_delivery_time(self):
-        """
-        Compute shortest delivery time across all offer details.
-        
-        Returns:
-            int: Shortest delivery time in days or 0 if none exist
+        Writes via a queryset update so updated_at is left untouched; callers
+        are expected to run this in the same transaction as the detail writes.
         """
-        details = self.details.all()
-        if details.exists():
-            return min(detail.delivery_time_in_days for detail in details)
-        return 0
+        aggregates = self.details.aggregate(
+            price=models.Min('price'),
+            delivery_time=models.Min('delivery_time_in_days'),
+        )
+        self.min_price = aggregates['price'] or 0
+        self.min_delivery_time = aggregates['delivery_time'] or 0
+        Offer.objects.filter(pk=self.pk).update(
+            min_price=self.min_price,
+            min_delivery_time=self.min_delivery_time,
+        )
 
 
 class OfferDetail(models.Model):
@@ -98,6 +113,12 @@ class OfferDetail(models.Model):
     features = models.JSONField(default=list)
     offer_type = models.CharField(max_length=20, choices=OFFER_TYPE_CHOICES)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['offer', 'price'], name='offerdetail_offer_price_idx'),
+            models.Index(fields=['offer', 'delivery_time_in_days'], name='offerdetail_offer_delivery_idx'),
+        ]
+
     def __str__(self):
         """String representation of the offer detail."""
         return f"{self.title} - {self.offer_type}"
@@ -129,6 +150,13 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'status'], name='order_business_status_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='order_business_created_idx'),
+            models.Index(fields=['customer_user', 'created_at'], name='order_customer_created_idx'),
+        ]
+
     def __str__(self):
         """String representation of the order."""
         return f"Order {self.id} - {self.title} ({self.status})"
@@ -144,10 +172,92 @@ class Order(models.Model):
             self.price = self.offer_detail.price
             self.features = self.offer_detail.features
             self.offer_type = self.offer_detail.offer_type
-            self.business_user = self.offer_detail.offer.user
+            self.business_user_id = self.offer_detail.offer.user_id
         super().save(*args, **kwargs)
 
 
+class OrderEvent(models.Model):
+    """
+    Append-only log of order changes.
+
+    The auto-increment id doubles as the change sequence number that
+    clients poll from (see settled()). order_id is kept as a plain value so events of
+    deleted orders survive.
+    """
+    EVENT_TYPE_CHOICES = [
+        ('created', 'Created'),
+        ('status_changed', 'Status changed'),
+        ('deleted', 'Deleted'),
+    ]
+
+    order_id = models.BigIntegerField()
+    customer_user = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='order_events_as_customer')
+    business_user = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='order_events_as_business')
+    event_type = models.CharField(max_length=20, choices=EVENT_TYPE_CHOICES)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    previous_status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer_user', 'id'], name='orderevent_customer_seq_idx'),
+            models.Index(fields=['business_user', 'id'], name='orderevent_business_seq_idx'),
+        ]
+
+    def __str__(self):
+        """String representation of the order event."""
+        return f"#{self.id} order {self.order_id} {self.event_type} ({self.status})"
+
+    @classmethod
+    def record(cls, order, event_type, previous_status=''):
+        """Append an event for the given order."""
+        return cls.objects.create(
+            order_id=order.pk,
+            customer_user_id=order.customer_user_id,
+            business_user_id=order.business_user_id,
+            event_type=event_type,
+            status=order.status,
+            previous_status=previous_status,
+        )
+
+    @classmethod
+    def settled(cls):
+        """
+        Events that may be handed out by sequence number.
+
+        Ids are assigned on INSERT but become visible on COMMIT, so with
+        concurrent writers (PostgreSQL) a lower id can show up after a client
+        has already moved past a higher one. Only events older than
+        ORDER_EVENT_SETTLE_SECONDS are returned; the window must exceed the
+        longest transaction that writes order events.
+        """
+        settle_seconds = order_event_settle_seconds()
+        if not settle_seconds:
+            return cls.objects.all()
+        return cls.objects.filter(created_at__lte=timezone.now() - timedelta(seconds=settle_seconds))
+
+
+class BusinessOrderCounter(models.Model):
+    """
+    Number of orders per business user and status.
+
+    Maintained with F() updates on order create, status change and delete so
+    the order count endpoints read a single row instead of counting orders.
+    """
+    business_user = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='order_counters')
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['business_user', 'status'], name='unique_business_order_status'),
+        ]
+
+    def __str__(self):
+        """String representation of the counter."""
+        return f"{self.business_user} - {self.status}: {self.count}"
+
+
 class Review(models.Model):
     """
     Review model.
@@ -161,7 +271,48 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'updated_at'], name='review_business_updated_idx'),
+        ]
+
     def __str__(self):
         """String representation of the review."""
         return f"Review by {self.reviewer} for {self.business_user}"
 
+
+
+class PlatformStats(models.Model):
+    """
+    Single row (pk=1) of platform-wide aggregates shown by the base info endpoint.
+
+    Kept up to date incrementally on review, offer and profile writes.
+    """
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        """String representation of the platform stats."""
+        return f"Platform stats ({self.review_count} reviews, {self.offer_count} offers)"
+
+
+class BusinessRatingStats(models.Model):
+    """
+    Incrementally maintained rating aggregates of a business user.
+    """
+    business_user = models.OneToOneField(
+        Profile, on_delete=models.CASCADE, primary_key=True, related_name='rating_stats'
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+
+    def __str__(self):
+        """String representation of the rating stats."""
+        return f"{self.business_user} - {self.review_count} reviews"
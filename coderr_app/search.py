@@ -0,0 +1,104 @@
+"""
+Full-text search index for offers.
+
+SQLite keeps an FTS5 shadow table in sync through model signals, PostgreSQL
+uses a generated tsvector column with a GIN index. Other backends fall back
+to the plain icontains search of DRF's SearchFilter. The index itself is
+created by migration 0003_offer_search_index.
+"""
+import re
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+
+SQLITE_TABLE = 'coderr_app_offer_search'
+POSTGRES_COLUMN = 'search_vector'
+POSTGRES_CONFIG = 'simple'
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_supported(using=None):
+    """
+    Return True if the database backend has a full-text index for offers.
+    """
+    return (using or connection).vendor in ('sqlite', 'postgresql')
+
+
+def index_offer(offer):
+    """
+    Write the offer's current title and description into the SQLite index.
+    PostgreSQL maintains its generated column itself.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid = %s", [offer.pk])
+        cursor.execute(
+            f"INSERT INTO {SQLITE_TABLE} (rowid, title, description) VALUES (%s, %s, %s)",
+            [offer.pk, offer.title, offer.description]
+        )
+
+
+def index_offers(offers):
+    """
+    Bulk variant of index_offer for offers created with bulk_create.
+    """
+    if connection.vendor != 'sqlite' or not offers:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT OR REPLACE INTO {SQLITE_TABLE} (rowid, title, description) VALUES (%s, %s, %s)",
+            [(offer.pk, offer.title, offer.description) for offer in offers]
+        )
+
+
+def unindex_offer(offer_id):
+    """
+    Remove an offer from the SQLite index.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid = %s", [offer_id])
+
+
+def build_match_query(terms):
+    """
+    Turn free user input into an FTS5 query: every word becomes a quoted
+    prefix term, so punctuation can never raise a syntax error.
+    """
+    tokens = TOKEN_RE.findall(terms)
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def search_offers(queryset, terms):
+    """
+    Restrict an Offer queryset to full-text matches for `terms` and annotate
+    `search_rank` (lower is better).
+    """
+    vendor = connection.vendor
+    if vendor == 'sqlite':
+        match = build_match_query(terms)
+        if not match:
+            return queryset
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s", (match,))
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT bm25({SQLITE_TABLE}) FROM {SQLITE_TABLE} "
+                f"WHERE {SQLITE_TABLE} MATCH %s AND rowid = coderr_app_offer.id",
+                (match,)
+            )
+        )
+    if vendor == 'postgresql':
+        tsquery = f"websearch_to_tsquery('{POSTGRES_CONFIG}', %s)"
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT id FROM coderr_app_offer WHERE {POSTGRES_COLUMN} @@ {tsquery}", (terms,)
+            )
+        ).annotate(
+            search_rank=RawSQL(f"-ts_rank(coderr_app_offer.{POSTGRES_COLUMN}, {tsquery})", (terms,))
+        )
+    raise NotImplementedError(f'No full-text index for backend {vendor!r}.')
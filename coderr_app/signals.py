@@ -0,0 +1,144 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from coderr_app import search
+from coderr_app.caching import bump_offer_list_version, invalidate_business_stats
+from coderr_app.counters import adjust_order_counter, adjust_platform_stats, add_review_to_stats
+from coderr_app.models import Profile, Offer, OfferDetail, Order, OrderEvent, Review
+from coderr_app.streams import broker
+
+
+@receiver(post_save, sender=Offer)
+def index_offer_on_save(sender, instance, **kwargs):
+    """Keep the full-text index in sync with created or updated offers."""
+    search.index_offer(instance)
+
+
+@receiver(post_delete, sender=Offer)
+def unindex_offer_on_delete(sender, instance, **kwargs):
+    """Drop deleted offers from the full-text index."""
+    search.unindex_offer(instance.pk)
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+@receiver(post_save, sender=Profile)
+def invalidate_offer_list_cache(sender, **kwargs):
+    """
+    Invalidate cached offer list pages once the write is committed.
+    Profiles are included because their names appear in user_details.
+    """
+    transaction.on_commit(bump_offer_list_version)
+
+
+@receiver(post_save, sender=Order)
+def count_created_order(sender, instance, created, **kwargs):
+    """Count new orders; status changes are handled by OrderUpdateSerializer."""
+    if created:
+        adjust_order_counter(instance.business_user_id, instance.status, 1)
+
+
+@receiver(post_delete, sender=Order)
+def uncount_deleted_order(sender, instance, **kwargs):
+    """Remove deleted orders (including cascades) from the counters."""
+    adjust_order_counter(instance.business_user_id, instance.status, -1)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_business_stats_for_business(sender, instance, **kwargs):
+    """Drop cached statistics of the affected business once the write is committed."""
+    profile_id = instance.business_user_id
+    transaction.on_commit(lambda: invalidate_business_stats(profile_id))
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_business_stats_for_offer(sender, instance, **kwargs):
+    """Offer counts are part of the statistics as well."""
+    profile_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_business_stats(profile_id))
+
+
+@receiver(post_save, sender=Review)
+def count_created_review(sender, instance, created, **kwargs):
+    """Add new reviews to the rating stats; rating changes are handled by ReviewUpdateSerializer."""
+    if created:
+        add_review_to_stats(instance, 1)
+
+
+@receiver(post_delete, sender=Review)
+def uncount_deleted_review(sender, instance, **kwargs):
+    """Remove deleted reviews (including cascades) from the rating stats."""
+    add_review_to_stats(instance, -1)
+
+
+@receiver(post_save, sender=Offer)
+def count_created_offer(sender, instance, created, **kwargs):
+    if created:
+        adjust_platform_stats(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def uncount_deleted_offer(sender, instance, **kwargs):
+    adjust_platform_stats(offer_count=-1)
+
+
+def offers_bulk_created(offers):
+    """
+    Do the bookkeeping of the Offer post_save receivers for offers inserted
+    with bulk_create, which sends no signals. Call inside the transaction.
+    """
+    if not offers:
+        return
+    search.index_offers(offers)
+    adjust_platform_stats(offer_count=len(offers))
+    transaction.on_commit(bump_offer_list_version)
+    for profile_id in {offer.user_id for offer in offers}:
+        transaction.on_commit(lambda profile_id=profile_id: invalidate_business_stats(profile_id))
+
+
+@receiver(post_save, sender=Profile)
+def count_created_business_profile(sender, instance, created, **kwargs):
+    if created and instance.type == 'business':
+        adjust_platform_stats(business_profile_count=1)
+
+
+@receiver(post_delete, sender=Profile)
+def uncount_deleted_business_profile(sender, instance, **kwargs):
+    if instance.type == 'business':
+        adjust_platform_stats(business_profile_count=-1)
+
+
+@receiver(post_save, sender=Order)
+def log_created_order(sender, instance, created, **kwargs):
+    """Append a created event; status changes are logged by OrderUpdateSerializer."""
+    if created:
+        OrderEvent.record(instance, 'created')
+
+
+@receiver(post_delete, sender=Order)
+def log_deleted_order(sender, instance, origin=None, **kwargs):
+    """
+    Append a deleted event. Skipped when a participant is being deleted,
+    since the event would reference that profile and be removed with it.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model in (Profile, User):
+        return
+    OrderEvent.record(instance, 'deleted')
+
+
+@receiver(post_save, sender=OrderEvent)
+def publish_order_event(sender, instance, created, **kwargs):
+    """Wake open order streams of both participants once the event is committed."""
+    if created:
+        profile_ids = (instance.customer_user_id, instance.business_user_id)
+        transaction.on_commit(lambda: broker.publish(*profile_ids))
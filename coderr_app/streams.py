@@ -0,0 +1,99 @@
+"""
+In-process pub/sub for order events.
+
+Streams subscribe per profile and are woken up when an order event of that
+profile is committed; the events themselves are always read from the
+OrderEvent log, so a wake-up can never be lost or delivered twice. Events
+written by other worker processes are picked up by the periodic poll each
+stream runs on its heartbeat interval.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+
+
+def max_streams():
+    return getattr(settings, 'ORDER_STREAM_MAX_CONNECTIONS', 200)
+
+
+def heartbeat_interval():
+    return getattr(settings, 'ORDER_STREAM_HEARTBEAT', 15)
+
+
+class Subscription:
+    """
+    Wake-up handle of one stream, bound to the event loop serving it.
+    """
+
+    def __init__(self, profile_id, loop):
+        self.profile_id = profile_id
+        self.loop = loop
+        self.wakeup = asyncio.Event()
+
+    def notify(self):
+        self.loop.call_soon_threadsafe(self.wakeup.set)
+
+    async def wait(self, timeout):
+        """
+        Wait for a notification; returns False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self.wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self.wakeup.clear()
+        return True
+
+
+class OrderEventBroker:
+    """
+    Registry of open order streams in this worker process.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+        self.active_streams = 0
+
+    def subscribe(self, profile_id):
+        """
+        Register a stream, or return None if the per-worker cap is reached.
+        """
+        with self._lock:
+            if self.active_streams >= max_streams():
+                return None
+            subscription = Subscription(profile_id, asyncio.get_running_loop())
+            self._subscriptions[profile_id].add(subscription)
+            self.active_streams += 1
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.profile_id)
+            if subscriptions and subscription in subscriptions:
+                subscriptions.discard(subscription)
+                self.active_streams -= 1
+                if not subscriptions:
+                    del self._subscriptions[subscription.profile_id]
+
+    def publish(self, *profile_ids):
+        """
+        Wake every stream of the given profiles. Safe to call from any thread.
+        """
+        with self._lock:
+            subscriptions = [
+                subscription
+                for profile_id in set(profile_ids)
+                for subscription in self._subscriptions.get(profile_id, ())
+            ]
+        for subscription in subscriptions:
+            try:
+                subscription.notify()
+            except RuntimeError:
+                # Event loop already closed; the stream is going away
+                pass
+
+
+broker = OrderEventBroker()
@@ -1,3 +1,275 @@
-from django.test import TestCase
+from unittest import skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.caching import local_token_cache
+from coderr_app.api.serializers import OrderUpdateSerializer, ReviewUpdateSerializer
+from coderr_app.models import (
+    Profile, Offer, OfferDetail, Order, OrderEvent, Review, BusinessOrderCounter,
+    BusinessRatingStats, PlatformStats
+)
+
+
+OFFER_TYPES = ['basic', 'standard', 'premium']
+
+
+def create_profile(username, profile_type, **fields):
+    """Create a user with profile and API token."""
+    user = User.objects.create_user(username=username, email=f'{username}@coderr.de', password='asdasd')
+    Token.objects.create(user=user)
+    return Profile.objects.create(username=user, email=user.email, type=profile_type, **fields)
+
+
+def create_offer(profile, title='Website', price=100, delivery_time=3, **fields):
+    """Create an offer with basic, standard and premium details."""
+    offer = Offer.objects.create(
+        user=profile, title=title, description=f'{title} description',
+        min_price=price, min_delivery_time=delivery_time, **fields
+    )
+    OfferDetail.objects.bulk_create([
+        OfferDetail(
+            offer=offer, title=f'{title} {offer_type}', revisions=n + 1,
+            delivery_time_in_days=delivery_time + n, price=price * (n + 1),
+            features=['Design', 'Hosting'][:n + 1], offer_type=offer_type
+        )
+        for n, offer_type in enumerate(OFFER_TYPES)
+    ])
+    return offer
+
+
+def token_client(profile):
+    return APIClient(HTTP_AUTHORIZATION=f'Token {profile.username.auth_token.key}')
+
+
+class APITestCase(TestCase):
+    """
+    Two businesses with offers, two customers with orders and reviews.
+    Caches are cleared per test, since TestCase never runs on_commit hooks.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_profile('max_business', 'business', first_name='Max', last_name='Mustermann')
+        cls.other_business = create_profile('jane_business', 'business', first_name='Jane')
+        cls.customer = create_profile('john_customer', 'customer', first_name='John')
+        cls.other_customer = create_profile('sarah_customer', 'customer', first_name='Sarah')
+        cls.offers = [
+            create_offer(cls.business, title=f'Offer {n}', price=50 * (n + 1), delivery_time=n + 1)
+            for n in range(5)
+        ] + [create_offer(cls.other_business, title='Logo', price=80, delivery_time=2)]
+        for customer in (cls.customer, cls.other_customer):
+            for detail in cls.offers[0].details.all():
+                Order.objects.create(customer_user=customer, offer_detail=detail)
+            Review.objects.create(business_user=cls.business, reviewer=customer, rating=4, description='Good')
+
+    def setUp(self):
+        cache.clear()
+        local_token_cache.clear()
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Checks SQLite query plans.')
+class QueryPlanTests(APITestCase):
+    """
+    No query behind the main read endpoints may fall back to a full table scan.
+    """
+
+    def query_plan(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertNoTableScan(self, url):
+        client = token_client(self.business)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        for query in queries.captured_queries:
+            if not query['sql'].startswith('SELECT'):
+                continue
+            for step in self.query_plan(query['sql']):
+                if step.startswith('SCAN '):
+                    self.assertIn('INDEX', step, f'{url}: {query["sql"]}')
+
+    def test_profile_list(self):
+        self.assertNoTableScan('/api/profiles/business/')
+
+    def test_offer_list(self):
+        for query in ['', '?min_price=100', '?max_delivery_time=2', '?ordering=min_price', '?creator_id=1']:
+            with self.subTest(query=query):
+                self.assertNoTableScan(f'/api/offers/{query}')
+
+    def test_order_list(self):
+        for query in ['', '?status=in_progress', '?offer_type=basic']:
+            with self.subTest(query=query):
+                self.assertNoTableScan(f'/api/orders/{query}')
+
+    def test_order_counts(self):
+        business_user_id = self.business.username_id
+        for url in ['order-count', 'completed-order-count', 'business-stats']:
+            with self.subTest(url=url):
+                self.assertNoTableScan(f'/api/{url}/{business_user_id}/')
+
+    def test_review_list(self):
+        self.assertNoTableScan(f'/api/reviews/?business_user_id={self.business.username_id}')
+
+    def test_order_changes(self):
+        self.assertNoTableScan('/api/orders/changes/?since=1')
+
+
+class OfferListQueryCountTests(APITestCase):
+    """
+    An offer list page costs the same number of queries at any page size:
+    COUNT(*), the offers with user and profile joined, and their details.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer.username)
+
+    def test_constant_queries_per_page(self):
+        for fast in (True, False):
+            for filters in ('', '&min_price=50&max_delivery_time=5'):
+                for page_size in (1, len(self.offers)):
+                    with self.subTest(fast=fast, filters=filters, page_size=page_size):
+                        with self.settings(OFFER_FAST_SERIALIZATION=fast), self.assertNumQueries(3):
+                            response = self.client.get(f'/api/offers/?page_size={page_size}{filters}')
+                        self.assertEqual(response.status_code, 200)
+                        self.assertEqual(len(response.data['results']), min(page_size, response.data['count']))
+
+
+class FastOfferSerializationTests(APITestCase):
+    """
+    The values() fast path must render exactly what the DRF serializers render.
+    """
+
+    def setUp(self):
+        super().setUp()
+        Offer.objects.filter(pk=self.offers[0].pk).update(image='offers/website.png')
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer.username)
+
+    def assertSameOutput(self, url):
+        responses = {}
+        for fast in (True, False):
+            with self.settings(OFFER_FAST_SERIALIZATION=fast):
+                responses[fast] = self.client.get(url)
+            self.assertEqual(responses[fast].status_code, 200, url)
+        self.assertEqual(responses[True].content, responses[False].content, url)
+
+    def test_offer_list(self):
+        for query in ['', '?expand=details', '?page_size=2&page=2', '?search=Logo']:
+            with self.subTest(query=query):
+                self.assertSameOutput(f'/api/offers/{query}')
+
+    def test_offer_detail(self):
+        for query in ['', '?expand=details']:
+            with self.subTest(query=query):
+                self.assertSameOutput(f'/api/offers/{self.offers[0].pk}/{query}')
+
+
+class WriteQueryCountTests(APITestCase):
+    """
+    Token authentication loads token, user and profile in one query, and
+    serializers and permissions reuse that profile instead of looking it up.
+    """
+
+    def test_create_order(self):
+        detail = self.offers[1].details.get(offer_type='standard')
+        client = token_client(self.customer)
+        # Token; detail exists (view) and detail with offer (serializer);
+        # savepoint, order, counter, event, release; business profile (response)
+        with self.assertNumQueries(9):
+            response = client.post('/api/orders/', {'offer_detail_id': detail.pk}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['customer_user'], self.customer.username_id)
+        self.assertEqual(response.data['business_user'], self.business.username_id)
+
+    def test_create_review(self):
+        reviewer = create_profile('emma_customer', 'customer')
+        client = token_client(reviewer)
+        # Token; business profile and duplicate check (validation);
+        # savepoint, review, rating stats, platform stats, release
+        with self.assertNumQueries(8):
+            response = client.post('/api/reviews/', {
+                'business_user': self.business.username_id, 'rating': 5, 'description': 'Great'
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['reviewer'], reviewer.username_id)
+        self.assertEqual(response.data['business_user'], self.business.username_id)
+
+
+class StaleUpdateTests(APITestCase):
+    """
+    Updates applied to instances loaded before a concurrent change must start
+    from the current row, not from the stale copy.
+    """
+
+    def test_order_status(self):
+        order = Order.objects.filter(business_user=self.business).first()
+        first, second = Order.objects.get(pk=order.pk), Order.objects.get(pk=order.pk)
+        for instance, new_status in ((first, 'completed'), (second, 'cancelled')):
+            serializer = OrderUpdateSerializer(instance, data={'status': new_status}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        counts = dict(BusinessOrderCounter.objects.filter(business_user=self.business).values_list('status', 'count'))
+        actual = Order.objects.filter(business_user=self.business)
+        for order_status in ('in_progress', 'completed', 'cancelled'):
+            self.assertEqual(counts.get(order_status, 0), actual.filter(status=order_status).count(), order_status)
+        last_event = OrderEvent.objects.filter(order_id=order.pk).latest('id')
+        self.assertEqual((last_event.previous_status, last_event.status), ('completed', 'cancelled'))
+
+    def test_review_rating(self):
+        review = Review.objects.filter(business_user=self.business).first()
+        first, second = Review.objects.get(pk=review.pk), Review.objects.get(pk=review.pk)
+        for instance, rating in ((first, 1), (second, 5)):
+            serializer = ReviewUpdateSerializer(instance, data={'rating': rating}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        ratings = list(Review.objects.filter(business_user=self.business).values_list('rating', flat=True))
+        stats = BusinessRatingStats.objects.get(business_user=self.business)
+        self.assertEqual(stats.rating_sum, sum(ratings))
+        for rating in range(1, 6):
+            self.assertEqual(getattr(stats, f'rating_{rating}'), ratings.count(rating), rating)
+        self.assertEqual(PlatformStats.objects.get().rating_sum, sum(Review.objects.values_list('rating', flat=True)))
+
+
+class AsyncExportTests(APITestCase):
+    """
+    Under ASGI the export must reach the client chunk by chunk through an
+    async iterator instead of being buffered by the handler.
+    """
+
+    def setUp(self):
+        super().setUp()
+        detail = self.offers[0].details.get(offer_type='basic')
+        Order.objects.bulk_create([
+            Order(
+                customer_user=self.customer, business_user=self.business, offer_detail=detail,
+                title=detail.title, revisions=detail.revisions, delivery_time_in_days=detail.delivery_time_in_days,
+                price=detail.price, features=detail.features, offer_type=detail.offer_type
+            )
+            for _ in range(150)
+        ])
+        self.headers = {'Authorization': f'Token {self.customer.username.auth_token.key}'}
+
+    async def test_order_export_streams(self):
+        client = AsyncClient()
+        for export_format in ('csv', 'ndjson'):
+            with self.subTest(export_format=export_format):
+                response = await client.get(f'/api/orders/export/{export_format}/', headers=self.headers)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.streaming)
+                self.assertTrue(response.is_async)
+                chunks = [chunk async for chunk in response.streaming_content]
+                self.assertGreater(len(chunks), 1)
+                lines = b''.join(chunks).splitlines()
+                self.assertEqual(len(lines), 153 + (export_format == 'csv'))
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -83,10 +84,64 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # The registration race test needs a file test database, where
+        # concurrent connections wait for each other's locks; it is skipped
+        # on the default in-memory one
+        'TEST': {'NAME': os.environ.get('TEST_DATABASE_NAME')},
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Use a shared backend (Redis/Memcached) in production so cache
+# invalidation reaches every worker process.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Seconds an anonymous offer list page stays cached
+OFFER_LIST_CACHE_TIMEOUT = 60
+
+# Server-Sent Events order stream (per worker process)
+ORDER_STREAM_MAX_CONNECTIONS = 200
+ORDER_STREAM_HEARTBEAT = 15
+
+# Maximum number of offers per bulk create request (list payload to /api/offers/)
+OFFER_BULK_CREATE_MAX = 100
+
+# Rows fetched per database round trip by the CSV/NDJSON exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Token authentication cache: shared cache timeout, plus a small in-process
+# LRU in front of it (other processes see invalidations only after its TTL)
+TOKEN_CACHE_TIMEOUT = 300
+TOKEN_LOCAL_CACHE_TTL = 5
+TOKEN_LOCAL_CACHE_SIZE = 1024
+
+# Optional stateless access tokens (Authorization: Bearer), HMAC-signed with
+# SECRET_KEY; the permanent token is the refresh token. Revocations live in
+# the cache, so they need a shared cache backend across processes.
+SIGNED_ACCESS_TOKENS = False
+ACCESS_TOKEN_LIFETIME = 300
+
+# Serve login/registration from async views that hash passwords in a bounded
+# thread pool (for ASGI). Workers default to the CPU count; requests beyond
+# MAX_PENDING running or queued hashes get a 503 instead of queueing.
+ASYNC_AUTH_VIEWS = False
+PASSWORD_HASH_WORKERS = None
+PASSWORD_HASH_MAX_PENDING = None
+
+# Seconds business statistics stay cached (invalidated on writes)
+BUSINESS_STATS_CACHE_TIMEOUT = 300
+
+# Serialize offer reads from values() projections instead of DRF serializers
+OFFER_FAST_SERIALIZATION = True
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -139,7 +194,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.api.authentication.ProfileTokenAuthentication',
+        'auth_app.api.authentication.SignedTokenAuthentication',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
@@ -159,8 +215,20 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 6,
+    'DEFAULT_RENDERER_CLASSES': [
+        'coderr_app.api.renderers.FastJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'coderr_app.api.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Browsable API only during development
+if DEBUG:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('rest_framework.renderers.BrowsableAPIRenderer')
+
 # CORS Settings
 CORS_ALLOW_ALL_ORIGINS = True  # Für Entwicklung - in Produktion spezifische Origins erlauben
 CORS_ALLOW_CREDENTIALS = True
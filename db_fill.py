@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from coderr_app.models import Profile, Offer, OfferDetail, Order, Review
 
 
@@ -839,6 +840,9 @@ review13 = Review.objects.create(
     description='Max hat eine atemberaubende Website für mein Startup erstellt. Die Kombination aus Design und Funktionalität ist perfekt.'
 )
 
+# Aggregierte Offer-Felder (min_price, min_delivery_time) befüllen
+call_command('backfill_offer_aggregates')
+
 
 print("✅ Testdaten erfolgreich erstellt!")
 print(f"📊 Erstellt: {User.objects.count()} Users, {Profile.objects.count()} Profiles, {Offer.objects.count()} Offers")